@@ -8,7 +8,23 @@ Run with --help for options.
 
 import argparse
 import sys
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Line items returned by calculate_total_costs(), in report order
+COST_FIELDS = (
+    'lambda_requests', 'lambda_duration', 'lambda_total',
+    'secrets_api', 'secrets_storage', 'secrets_total',
+    'eventbridge',
+    'cloudwatch_logs_ingestion', 'cloudwatch_logs_storage',
+    'cloudwatch_metrics', 'cloudwatch_alarms', 'cloudwatch_total',
+    'xray', 's3',
+    'sqs_dlq', 'sns_notifications', 'sqs_sns_total',
+    'services_total', 'grand_total',
+)
 
 
 class CostCalculator:
@@ -29,6 +45,11 @@ class CostCalculator:
     SQS_REQUESTS = 0.40 / 1_000_000  # Per 1M requests
     SNS_NOTIFICATIONS = 0.50 / 1_000_000  # Per 1M notifications
 
+    # Scenario-invariant constants
+    _BYTES_PER_GB_INV = 1.0 / (1024 ** 3)
+    _LOG_BYTES_PER_REPLICATION = 2 * 1024  # ~2KB of logs per replication
+    _PACKAGE_SIZE_GB = 10.0 / 1024.0  # ~10MB Lambda package
+
     def __init__(self, replications_per_month: int, num_secrets: int,
                  lambda_memory_mb: int = 512, avg_duration_sec: float = 3.0,
                  enable_metrics: bool = True, enable_alarms: bool = True):
@@ -50,183 +71,251 @@ class CostCalculator:
         self.enable_metrics = enable_metrics
         self.enable_alarms = enable_alarms
 
+    @classmethod
+    def _line_items(cls, replications, num_secrets, lambda_memory_gb, duration_sec,
+                    metrics_on, alarms_on, dlq_messages) -> Dict[str, Any]:
+        """
+        Every cost line item, in COST_FIELDS order
+
+        The single copy of the pricing formulas, shared by the scalar
+        calculate_* methods and the vectorized sweep(). Plain arithmetic only,
+        so arguments may be Python numbers or NumPy arrays; the enable flags
+        are used as 0/1 multipliers and the DLQ message count (which needs
+        rounding) is computed by the caller.
+        """
+        costs = {}
+
+        # Lambda
+        costs['lambda_requests'] = replications * cls.LAMBDA_REQUEST_COST
+        costs['lambda_duration'] = (replications * duration_sec *
+                                    lambda_memory_gb * cls.LAMBDA_DURATION_COST)
+        costs['lambda_total'] = costs['lambda_requests'] + costs['lambda_duration']
+
+        # Secrets Manager: 2 API calls per replication (GetSecretValue + PutSecretValue)
+        costs['secrets_api'] = replications * 2 * cls.SECRETS_API_COST
+        costs['secrets_storage'] = num_secrets * cls.SECRETS_STORAGE_COST
+        costs['secrets_total'] = costs['secrets_api'] + costs['secrets_storage']
+
+        costs['eventbridge'] = replications * cls.EVENTBRIDGE_COST
+
+        # CloudWatch: ~2KB of logs per replication
+        log_size_gb = replications * cls._LOG_BYTES_PER_REPLICATION * cls._BYTES_PER_GB_INV
+        costs['cloudwatch_logs_ingestion'] = log_size_gb * cls.CLOUDWATCH_LOGS_INGESTION
+        costs['cloudwatch_logs_storage'] = log_size_gb * cls.CLOUDWATCH_LOGS_STORAGE
+        # 4 custom metrics per replication (success/failure/duration/throttle)
+        costs['cloudwatch_metrics'] = replications * 4 * cls.CLOUDWATCH_METRICS * metrics_on
+        # 3 alarms (failure, throttling, high duration)
+        costs['cloudwatch_alarms'] = 3 * cls.CLOUDWATCH_ALARM * alarms_on
+        costs['cloudwatch_total'] = (costs['cloudwatch_logs_ingestion'] +
+                                     costs['cloudwatch_logs_storage'] +
+                                     costs['cloudwatch_metrics'] +
+                                     costs['cloudwatch_alarms'])
+
+        costs['xray'] = replications * cls.XRAY_TRACES
+        # S3 storage for SAR packages
+        costs['s3'] = cls._PACKAGE_SIZE_GB * cls.S3_STORAGE
+
+        # SQS DLQ, plus SNS notifications for alarms (assume 2 per month)
+        costs['sqs_dlq'] = dlq_messages * cls.SQS_REQUESTS
+        costs['sns_notifications'] = 2 * cls.SNS_NOTIFICATIONS * alarms_on
+        costs['sqs_sns_total'] = costs['sqs_dlq'] + costs['sns_notifications']
+
+        # Services total (excluding Secrets Manager storage)
+        costs['services_total'] = (
+            costs['lambda_total'] +
+            costs['secrets_api'] +
+            costs['eventbridge'] +
+            costs['cloudwatch_total'] +
+            costs['xray'] +
+            costs['s3'] +
+            costs['sqs_sns_total']
+        )
+
+        # Grand total (including Secrets Manager storage)
+        costs['grand_total'] = costs['services_total'] + costs['secrets_storage']
+
+        return costs
+
+    def _select(self, *fields: str) -> Dict[str, float]:
+        """Subset of calculate_total_costs() for one report section"""
+        costs = self.calculate_total_costs()
+        return {name: costs[name] for name in fields}
+
     def calculate_lambda_costs(self) -> Dict[str, float]:
         """Calculate Lambda costs"""
-        request_cost = self.replications * self.LAMBDA_REQUEST_COST
-        duration_cost = (self.replications * self.duration_sec *
-                        self.lambda_memory_gb * self.LAMBDA_DURATION_COST)
-
-        return {
-            'lambda_requests': request_cost,
-            'lambda_duration': duration_cost,
-            'lambda_total': request_cost + duration_cost
-        }
+        return self._select('lambda_requests', 'lambda_duration', 'lambda_total')
 
     def calculate_secrets_manager_costs(self) -> Dict[str, float]:
         """Calculate Secrets Manager costs"""
-        # 2 API calls per replication (GetSecretValue + PutSecretValue)
-        api_calls = self.replications * 2
-        api_cost = api_calls * self.SECRETS_API_COST
-        storage_cost = self.num_secrets * self.SECRETS_STORAGE_COST
-
-        return {
-            'secrets_api': api_cost,
-            'secrets_storage': storage_cost,
-            'secrets_total': api_cost + storage_cost
-        }
+        return self._select('secrets_api', 'secrets_storage', 'secrets_total')
 
     def calculate_eventbridge_costs(self) -> float:
         """Calculate EventBridge costs"""
-        return self.replications * self.EVENTBRIDGE_COST
+        return self.calculate_total_costs()['eventbridge']
 
     def calculate_cloudwatch_costs(self) -> Dict[str, float]:
         """Calculate CloudWatch costs"""
-        # Estimate log size: ~2KB per replication
-        log_size_gb = (self.replications * 2 * 1024) / (1024 ** 3)
-
-        log_ingestion = log_size_gb * self.CLOUDWATCH_LOGS_INGESTION
-        log_storage = log_size_gb * self.CLOUDWATCH_LOGS_STORAGE
-
-        # Custom metrics (if enabled)
-        metrics_cost = 0.0
-        if self.enable_metrics:
-            # 4 custom metrics per replication (success/failure/duration/throttle)
-            metrics_count = self.replications * 4
-            metrics_cost = metrics_count * self.CLOUDWATCH_METRICS
-
-        # Alarms (if enabled)
-        alarm_cost = 0.0
-        if self.enable_alarms:
-            # 3 alarms (failure, throttling, high duration)
-            alarm_cost = 3 * self.CLOUDWATCH_ALARM
-
-        return {
-            'cloudwatch_logs_ingestion': log_ingestion,
-            'cloudwatch_logs_storage': log_storage,
-            'cloudwatch_metrics': metrics_cost,
-            'cloudwatch_alarms': alarm_cost,
-            'cloudwatch_total': log_ingestion + log_storage + metrics_cost + alarm_cost
-        }
+        return self._select('cloudwatch_logs_ingestion', 'cloudwatch_logs_storage',
+                            'cloudwatch_metrics', 'cloudwatch_alarms', 'cloudwatch_total')
 
     def calculate_xray_costs(self) -> float:
         """Calculate X-Ray costs"""
-        return self.replications * self.XRAY_TRACES
+        return self.calculate_total_costs()['xray']
 
     def calculate_s3_costs(self) -> float:
         """Calculate S3 costs (for SAR packages)"""
-        # Assume ~10MB Lambda package
-        package_size_gb = 10 / 1024
-        return package_size_gb * self.S3_STORAGE
+        return self.calculate_total_costs()['s3']
 
     def calculate_sqs_sns_costs(self) -> Dict[str, float]:
         """Calculate SQS/SNS costs"""
-        # Assume 1% failure rate to DLQ
-        dlq_messages = max(1, int(self.replications * 0.01))
-        sqs_cost = dlq_messages * self.SQS_REQUESTS
-
-        # SNS notifications for alarms (assume 2 per month)
-        sns_cost = 2 * self.SNS_NOTIFICATIONS if self.enable_alarms else 0.0
-
-        return {
-            'sqs_dlq': sqs_cost,
-            'sns_notifications': sns_cost,
-            'sqs_sns_total': sqs_cost + sns_cost
-        }
+        return self._select('sqs_dlq', 'sns_notifications', 'sqs_sns_total')
 
     def calculate_total_costs(self) -> Dict[str, float]:
         """Calculate total monthly costs"""
-        lambda_costs = self.calculate_lambda_costs()
-        secrets_costs = self.calculate_secrets_manager_costs()
-        eventbridge_cost = self.calculate_eventbridge_costs()
-        cloudwatch_costs = self.calculate_cloudwatch_costs()
-        xray_cost = self.calculate_xray_costs()
-        s3_cost = self.calculate_s3_costs()
-        sqs_sns_costs = self.calculate_sqs_sns_costs()
-
-        # Compute services total (excluding Secrets Manager storage)
-        services_total = (
-            lambda_costs['lambda_total'] +
-            secrets_costs['secrets_api'] +
-            eventbridge_cost +
-            cloudwatch_costs['cloudwatch_total'] +
-            xray_cost +
-            s3_cost +
-            sqs_sns_costs['sqs_sns_total']
+        return self._line_items(
+            self.replications, self.num_secrets, self.lambda_memory_gb, self.duration_sec,
+            metrics_on=float(self.enable_metrics),
+            alarms_on=float(self.enable_alarms),
+            # Assume 1% failure rate to DLQ
+            dlq_messages=max(1, int(self.replications * 0.01)),
         )
 
-        # Grand total (including Secrets Manager storage)
-        grand_total = services_total + secrets_costs['secrets_storage']
-
-        return {
-            **lambda_costs,
-            **secrets_costs,
-            'eventbridge': eventbridge_cost,
-            **cloudwatch_costs,
-            'xray': xray_cost,
-            's3': s3_cost,
-            **sqs_sns_costs,
-            'services_total': services_total,
-            'grand_total': grand_total
-        }
+    @classmethod
+    def sweep(cls, replications, num_secrets, memory_mb, duration_sec,
+              enable_metrics=True, enable_alarms=True) -> Dict[str, 'np.ndarray']:
+        """
+        Calculate costs for a grid of scenarios in one vectorized pass
+
+        Inputs are broadcast against each other with NumPy broadcasting rules,
+        so a sensitivity analysis can pass e.g. replications[:, None] and
+        memory_mb[None, :] to get a 2-D grid of results. Requires NumPy.
+
+        Args:
+            replications: Replications per month (array-like)
+            num_secrets: Number of destination secrets stored (array-like)
+            memory_mb: Lambda memory allocation in MB (array-like)
+            duration_sec: Average Lambda duration in seconds (array-like)
+            enable_metrics: Whether CloudWatch custom metrics are enabled
+            enable_alarms: Whether CloudWatch alarms are enabled
+
+        Returns:
+            Dict with the same keys as calculate_total_costs(), each mapping
+            to a float64 array of the broadcast shape
+        """
+        import numpy as np
+
+        replications, num_secrets, memory_mb, duration_sec, metrics_on, alarms_on = (
+            np.broadcast_arrays(
+                np.asarray(replications, dtype=np.float64),
+                np.asarray(num_secrets, dtype=np.float64),
+                np.asarray(memory_mb, dtype=np.float64),
+                np.asarray(duration_sec, dtype=np.float64),
+                np.asarray(enable_metrics, dtype=np.float64),
+                np.asarray(enable_alarms, dtype=np.float64),
+            )
+        )
+
+        costs = cls._line_items(
+            replications, num_secrets, memory_mb / 1024, duration_sec,
+            metrics_on=metrics_on,
+            alarms_on=alarms_on,
+            dlq_messages=np.maximum(1, np.floor(replications * 0.01)),
+        )
+        # Scenario-independent items (e.g. S3) come back as scalars; give every
+        # item its own float64 array of the broadcast shape
+        return {name: np.array(np.broadcast_to(value, replications.shape), dtype=np.float64)
+                for name, value in costs.items()}
+
+    @classmethod
+    def evaluate_scenarios(cls, replications, num_secrets, memory_mb, duration_sec,
+                           enable_metrics, enable_alarms) -> 'np.ndarray':
+        """
+        Evaluate many independent scenarios into one packed result array
+
+        Intended for Monte Carlo runs: pass one 1-D array per parameter
+        (length N) and get back a contiguous (N, len(COST_FIELDS)) float64
+        array whose columns follow COST_FIELDS. Requires NumPy.
+
+        Args:
+            replications: Replications per month, shape (N,)
+            num_secrets: Number of destination secrets stored, shape (N,)
+            memory_mb: Lambda memory allocation in MB, shape (N,)
+            duration_sec: Average Lambda duration in seconds, shape (N,)
+            enable_metrics: Whether custom metrics are enabled, shape (N,) or scalar
+            enable_alarms: Whether alarms are enabled, shape (N,) or scalar
+
+        Returns:
+            Array of shape (N, len(COST_FIELDS))
+        """
+        import numpy as np
+
+        costs = cls.sweep(replications, num_secrets, memory_mb, duration_sec,
+                          enable_metrics, enable_alarms)
+        return np.ascontiguousarray(
+            np.stack([costs[name].ravel() for name in COST_FIELDS], axis=1))
 
     def print_report(self):
         """Print formatted cost report"""
         costs = self.calculate_total_costs()
 
-        print("=" * 70)
-        print("AWS Secrets Replicator - Monthly Cost Estimate")
-        print("=" * 70)
-        print()
-        print("Usage Parameters:")
-        print(f"  Replications per month:     {self.replications:,}")
-        print(f"  Destination secrets:        {self.num_secrets}")
-        print(f"  Lambda memory:              {int(self.lambda_memory_gb * 1024)} MB")
-        print(f"  Avg Lambda duration:        {self.duration_sec} seconds")
-        print(f"  Custom metrics enabled:     {self.enable_metrics}")
-        print(f"  CloudWatch alarms enabled:  {self.enable_alarms}")
-        print()
-        print("-" * 70)
-        print("Cost Breakdown:")
-        print("-" * 70)
-        print()
-        print("Lambda:")
-        print(f"  Invocations:                ${costs['lambda_requests']:.4f}")
-        print(f"  Duration:                   ${costs['lambda_duration']:.4f}")
-        print(f"  Subtotal:                   ${costs['lambda_total']:.4f}")
-        print()
-        print("Secrets Manager:")
-        print(f"  API calls (Get/Put):        ${costs['secrets_api']:.4f}")
-        print(f"  Secret storage:             ${costs['secrets_storage']:.2f}")
-        print(f"  Subtotal:                   ${costs['secrets_total']:.2f}")
-        print()
-        print("EventBridge:")
-        print(f"  Events:                     ${costs['eventbridge']:.4f}")
-        print()
-        print("CloudWatch:")
-        print(f"  Logs ingestion:             ${costs['cloudwatch_logs_ingestion']:.4f}")
-        print(f"  Logs storage:               ${costs['cloudwatch_logs_storage']:.4f}")
-        print(f"  Custom metrics:             ${costs['cloudwatch_metrics']:.4f}")
-        print(f"  Alarms:                     ${costs['cloudwatch_alarms']:.2f}")
-        print(f"  Subtotal:                   ${costs['cloudwatch_total']:.2f}")
-        print()
-        print("Other Services:")
-        print(f"  X-Ray traces:               ${costs['xray']:.4f}")
-        print(f"  S3 storage (packages):      ${costs['s3']:.4f}")
-        print(f"  SQS/SNS:                    ${costs['sqs_sns_total']:.4f}")
-        print()
-        print("=" * 70)
-        print(f"Services Total (excl. secrets storage):   ${costs['services_total']:.2f}")
-        print(f"Secrets Storage ({self.num_secrets} secrets):             ${costs['secrets_storage']:.2f}")
-        print(f"MONTHLY TOTAL:                             ${costs['grand_total']:.2f}")
-        print("=" * 70)
-        print()
-        print("Notes:")
-        print("  - Prices based on US regions (2024)")
-        print("  - Free tier not included (see AWS Free Tier for details)")
-        print("  - Secrets storage is the largest cost component")
-        print("  - Use --no-metrics to disable custom metrics and reduce costs")
-        print("  - Use --no-alarms to disable CloudWatch alarms and reduce costs")
-        print()
+        # Build the whole report and write it once (one write call, one log record)
+        lines = [
+            "=" * 70,
+            "AWS Secrets Replicator - Monthly Cost Estimate",
+            "=" * 70,
+            "",
+            "Usage Parameters:",
+            f"  Replications per month:     {self.replications:,}",
+            f"  Destination secrets:        {self.num_secrets}",
+            f"  Lambda memory:              {int(self.lambda_memory_gb * 1024)} MB",
+            f"  Avg Lambda duration:        {self.duration_sec} seconds",
+            f"  Custom metrics enabled:     {self.enable_metrics}",
+            f"  CloudWatch alarms enabled:  {self.enable_alarms}",
+            "",
+            "-" * 70,
+            "Cost Breakdown:",
+            "-" * 70,
+            "",
+            "Lambda:",
+            f"  Invocations:                ${costs['lambda_requests']:.4f}",
+            f"  Duration:                   ${costs['lambda_duration']:.4f}",
+            f"  Subtotal:                   ${costs['lambda_total']:.4f}",
+            "",
+            "Secrets Manager:",
+            f"  API calls (Get/Put):        ${costs['secrets_api']:.4f}",
+            f"  Secret storage:             ${costs['secrets_storage']:.2f}",
+            f"  Subtotal:                   ${costs['secrets_total']:.2f}",
+            "",
+            "EventBridge:",
+            f"  Events:                     ${costs['eventbridge']:.4f}",
+            "",
+            "CloudWatch:",
+            f"  Logs ingestion:             ${costs['cloudwatch_logs_ingestion']:.4f}",
+            f"  Logs storage:               ${costs['cloudwatch_logs_storage']:.4f}",
+            f"  Custom metrics:             ${costs['cloudwatch_metrics']:.4f}",
+            f"  Alarms:                     ${costs['cloudwatch_alarms']:.2f}",
+            f"  Subtotal:                   ${costs['cloudwatch_total']:.2f}",
+            "",
+            "Other Services:",
+            f"  X-Ray traces:               ${costs['xray']:.4f}",
+            f"  S3 storage (packages):      ${costs['s3']:.4f}",
+            f"  SQS/SNS:                    ${costs['sqs_sns_total']:.4f}",
+            "",
+            "=" * 70,
+            f"Services Total (excl. secrets storage):   ${costs['services_total']:.2f}",
+            f"Secrets Storage ({self.num_secrets} secrets):             ${costs['secrets_storage']:.2f}",
+            f"MONTHLY TOTAL:                             ${costs['grand_total']:.2f}",
+            "=" * 70,
+            "",
+            "Notes:",
+            "  - Prices based on US regions (2024)",
+            "  - Free tier not included (see AWS Free Tier for details)",
+            "  - Secrets storage is the largest cost component",
+            "  - Use --no-metrics to disable custom metrics and reduce costs",
+            "  - Use --no-alarms to disable CloudWatch alarms and reduce costs",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -5,8 +5,9 @@ Provides high-level interfaces for secret management with
 cross-account support via STS AssumeRole.
 """
 
-import boto3
-from typing import Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Tuple
 from botocore.exceptions import ClientError
 from dataclasses import dataclass
 from logger import setup_logger
@@ -23,19 +24,109 @@ from exceptions import (
 # Initialize module logger
 logger = setup_logger("aws_clients")
 
+# Connection pool size for Secrets Manager clients (also bounds batch concurrency)
+MAX_POOL_CONNECTIONS = 50
 
-@dataclass
+# boto3 is imported on first client construction rather than at module import,
+# which keeps it (and botocore's config machinery) off the cold-start path of
+# modules that only need this one for types or constants
+boto3 = None
+
+# Tuned botocore configuration shared by all Secrets Manager clients (built lazily)
+_client_config = None
+
+
+def _lazy_boto3() -> Any:
+    """Import boto3 on first use and return the module."""
+    global boto3
+    if boto3 is None:
+        import boto3 as _boto3
+
+        boto3 = _boto3
+    return boto3
+
+
+def _get_client_config() -> Any:
+    """
+    Return the shared botocore Config for Secrets Manager clients.
+
+    Botocore retries stay low because get_secret/put_secret already retry
+    transient errors via with_retries; adaptive mode adds client-side rate
+    limiting when Secrets Manager starts throttling.
+    """
+    global _client_config
+    if _client_config is None:
+        from botocore.config import Config
+
+        _client_config = Config(
+            retries={"mode": "adaptive", "max_attempts": 3},
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+            connect_timeout=2,
+            read_timeout=5,
+            user_agent_extra="secrets-replicator",
+        )
+    return _client_config
+
+
+# Reuse assumed-role credentials until they are this close to expiring
+CREDENTIAL_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Shared STS client and AssumeRole credential cache (persist across Lambda invocations),
+# keyed by (role ARN, external ID, session name) as stored on SecretsManagerClient
+_sts_client = None
+_credentials_cache: Dict[Tuple[Optional[str], Optional[str], str], Dict[str, Any]] = {}
+
+
+def _get_sts_client() -> Any:
+    """Return the shared STS client, creating it on first use."""
+    global _sts_client
+    if _sts_client is None:
+        _sts_client = _lazy_boto3().client("sts")
+    return _sts_client
+
+
+def get_caller_account_id() -> str:
+    """Return the account ID of the Lambda's own credentials via the shared STS client."""
+    return str(_get_sts_client().get_caller_identity()["Account"])
+
+
+def _credentials_are_fresh(credentials: Dict[str, Any]) -> bool:
+    """Check whether cached AssumeRole credentials are still usable."""
+    expiration = credentials.get("Expiration")
+    if not isinstance(expiration, datetime):
+        return False
+    if expiration.tzinfo is None:
+        expiration = expiration.replace(tzinfo=timezone.utc)
+    return expiration - datetime.now(timezone.utc) > CREDENTIAL_REFRESH_MARGIN
+
+
+def clear_client_cache():
+    """
+    Clear the shared STS client and cached AssumeRole credentials.
+
+    Useful for testing and forcing fresh role assumption.
+    """
+    global _sts_client
+    _sts_client = None
+    _credentials_cache.clear()
+
+
+@dataclass(slots=True, frozen=True)
 class SecretValue:
     """
     Container for secret value and metadata.
 
+    Instances are immutable and hashable, so identical values returned by
+    batch retrievals can be deduplicated in sets or used as dict keys.
+
     Attributes:
         secret_string: String secret value (None if binary)
         secret_binary: Binary secret value (None if string)
         arn: Full ARN of the secret
         name: Name of the secret
         version_id: Version ID
-        version_stages: List of version stages (e.g., ['AWSCURRENT'])
+        version_stages: Tuple of version stages (e.g., ('AWSCURRENT',))
         created_date: Creation date
     """
 
@@ -44,7 +135,7 @@ class SecretValue:
     arn: Optional[str] = None
     name: Optional[str] = None
     version_id: Optional[str] = None
-    version_stages: Optional[list] = None
+    version_stages: Optional[Tuple[str, ...]] = None
     created_date: Optional[str] = None
 
 
@@ -96,41 +187,54 @@ class SecretsManagerClient:
         if role_arn:
             self._client = self._create_client_with_assumed_role()
         else:
-            self._client = boto3.client("secretsmanager", region_name=region)
+            self._client = _lazy_boto3().client(
+                "secretsmanager", region_name=region, config=_get_client_config()
+            )
 
     def _create_client_with_assumed_role(self) -> Any:
         """
         Create Secrets Manager client with assumed role credentials.
 
+        Credentials are cached per (role, external ID, session name) and
+        reused until they are within CREDENTIAL_REFRESH_MARGIN of expiring.
+
         Returns:
             Boto3 Secrets Manager client with assumed role credentials
 
         Raises:
             AccessDeniedError: If role assumption fails
         """
-        try:
-            # Create STS client
-            sts = boto3.client("sts")
-
-            # Build assume role parameters
-            assume_role_params = {"RoleArn": self.role_arn, "RoleSessionName": self.session_name}
-
-            if self.external_id:
-                assume_role_params["ExternalId"] = self.external_id
-
-            # Assume role
-            logger.info(f"Assuming role: {self.role_arn}")
-            response = sts.assume_role(**assume_role_params)
+        cache_key = (self.role_arn, self.external_id, self.session_name)
+        credentials = _credentials_cache.get(cache_key)
 
-            credentials = response["Credentials"]
+        try:
+            if credentials is None or not _credentials_are_fresh(credentials):
+                # Build assume role parameters
+                assume_role_params = {
+                    "RoleArn": self.role_arn,
+                    "RoleSessionName": self.session_name,
+                }
+
+                if self.external_id:
+                    assume_role_params["ExternalId"] = self.external_id
+
+                # Assume role
+                logger.info(f"Assuming role: {self.role_arn}")
+                response = _get_sts_client().assume_role(**assume_role_params)
+
+                credentials = response["Credentials"]
+                _credentials_cache[cache_key] = credentials
+            else:
+                logger.debug(f"Using cached credentials for role: {self.role_arn}")
 
             # Create client with temporary credentials
-            return boto3.client(
+            return _lazy_boto3().client(
                 "secretsmanager",
                 region_name=self.region,
                 aws_access_key_id=credentials["AccessKeyId"],
                 aws_secret_access_key=credentials["SecretAccessKey"],
                 aws_session_token=credentials["SessionToken"],
+                config=_get_client_config(),
             )
 
         except ClientError as e:
@@ -192,13 +296,56 @@ class SecretsManagerClient:
                 arn=response.get("ARN"),
                 name=response.get("Name"),
                 version_id=response.get("VersionId"),
-                version_stages=response.get("VersionStages", []),
+                version_stages=tuple(response.get("VersionStages", ())),
                 created_date=response.get("CreatedDate"),
             )
 
         except ClientError as e:
             self._handle_client_error(e, f"get_secret({secret_id})")
 
+    def get_secrets_batch(
+        self, secret_ids: List[str], max_workers: int = 16
+    ) -> Dict[str, SecretValue]:
+        """
+        Retrieve several secrets concurrently.
+
+        Each secret is fetched with get_secret (including its retry behavior)
+        on a thread pool, so total latency is close to a single round-trip
+        instead of one round-trip per secret.
+
+        Args:
+            secret_ids: Secret names or ARNs to retrieve
+            max_workers: Maximum number of concurrent requests (capped at the
+                client connection pool size)
+
+        Returns:
+            Dict mapping each requested secret ID to its SecretValue
+
+        Raises:
+            SecretNotFoundError: If any secret does not exist
+            AccessDeniedError: If access is denied to any secret
+            AWSClientError: For other AWS errors
+
+        Examples:
+            >>> client = SecretsManagerClient('us-east-1')
+            >>> secrets = client.get_secrets_batch(['db-creds', 'api-key'])
+            >>> secrets['api-key'].secret_string
+            'abc123'
+        """
+        unique_ids = list(dict.fromkeys(secret_ids))
+        if not unique_ids:
+            return {}
+
+        workers = max(1, min(max_workers, len(unique_ids), MAX_POOL_CONNECTIONS))
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.get_secret, sid): sid for sid in unique_ids}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
     @with_retries(max_attempts=5, min_wait=2, max_wait=32)
     def put_secret(
         self,
@@ -211,8 +358,9 @@ class SecretsManagerClient:
         """
         Create or update a secret in Secrets Manager.
 
-        If secret exists, updates the value. If it doesn't exist, creates it.
-        Automatically retries on transient errors (throttling, internal errors)
+        Tries to update the secret value first and only creates the secret
+        when it does not exist yet, so the common update path costs a single
+        API call. Automatically retries on transient errors (throttling, internal errors)
         with exponential backoff (2s, 4s, 8s, 16s, 32s) and jitter.
 
         Args:
@@ -238,21 +386,17 @@ class SecretsManagerClient:
             'abc123-def456-...'
         """
         try:
-            # Check if secret exists
-            exists = self.secret_exists(secret_id)
-
-            if exists:
-                # Update existing secret value
-                params = {"SecretId": secret_id, "SecretString": secret_value}
-
-                response = self._client.put_secret_value(**params)
-
-                # Update description if provided (requires separate API call)
-                if description is not None:
-                    self._client.update_secret(SecretId=secret_id, Description=description)
-
-            else:
-                # Create new secret
+            # Optimistically update the existing secret; this is the common
+            # path and avoids a describe_secret round-trip per write
+            try:
+                response = self._client.put_secret_value(
+                    SecretId=secret_id, SecretString=secret_value
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ResourceNotFoundException":
+                    raise
+
+                # Secret does not exist yet - create it
                 params = {"Name": secret_id, "SecretString": secret_value}
 
                 if kms_key_id:
@@ -266,6 +410,10 @@ class SecretsManagerClient:
                     params["Tags"] = [{"Key": k, "Value": v} for k, v in tags.items()]
 
                 response = self._client.create_secret(**params)
+            else:
+                # Update description if provided (requires separate API call)
+                if description is not None:
+                    self._client.update_secret(SecretId=secret_id, Description=description)
 
             return {
                 "ARN": response.get("ARN"),
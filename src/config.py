@@ -4,10 +4,12 @@ Configuration management for secrets replicator.
 Loads configuration from environment variables with validation.
 """
 
-import json
 import os
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Optional, List, Dict, Mapping, NamedTuple, Sequence, Tuple
 
 # Hardcoded prefixes for security and consistency
 TRANSFORMATION_SECRET_PREFIX = "secrets-replicator/transformations/"
@@ -15,6 +17,38 @@ FILTER_SECRET_PREFIX = "secrets-replicator/filters/"
 NAME_MAPPING_PREFIX = "secrets-replicator/names/"
 DEFAULT_DESTINATIONS_SECRET = "secrets-replicator/config/destinations"
 
+# Leading component of every supported AWS region name
+VALID_REGION_PREFIXES = frozenset({"us", "eu", "ap", "ca", "sa", "af", "me", "il", "cn"})
+
+# Lowercased environment variable values that enable a boolean setting
+TRUTHY_ENV_VALUES = frozenset({"true", "1", "yes", "on", "t", "y", "enabled"})
+
+# Accepted ReplicatorConfig values (WARN is normalized to WARNING)
+VALID_TRANSFORM_MODES = frozenset({"auto", "sed", "json"})
+VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARN", "WARNING", "ERROR", "CRITICAL"})
+
+# Upper, lower and title case log level spellings mapped to the Python logging name
+LOG_LEVEL_CANONICAL = {
+    spelling: "WARNING" if level == "WARN" else level
+    for level in VALID_LOG_LEVELS
+    for spelling in (level, level.lower(), level.title())
+}
+
+# Destination JSON keys accepted in either snake_case or camelCase, mapped to the
+# DestinationConfig field they populate (snake_case wins when both are set)
+DESTINATION_FIELD_ALIASES = {
+    "account_role_arn": "account_role_arn",
+    "accountRoleArn": "account_role_arn",
+    "external_id": "external_id",
+    "externalId": "external_id",
+    "secret_names": "secret_names",
+    "secretNames": "secret_names",
+    "secret_names_cache_ttl": "secret_names_cache_ttl",
+    "secretNamesCacheTTL": "secret_names_cache_ttl",
+    "kms_key_id": "kms_key_id",
+    "kmsKeyId": "kms_key_id",
+}
+
 
 class ConfigurationError(Exception):
     """Raised when configuration is invalid"""
@@ -22,7 +56,7 @@ class ConfigurationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DestinationConfig:
     """Configuration for a single replication destination"""
 
@@ -32,9 +66,13 @@ class DestinationConfig:
     secret_names: Optional[str] = None  # Comma-separated list of name mapping secret names
     secret_names_cache_ttl: int = 300  # Cache TTL for name mappings (seconds)
     kms_key_id: Optional[str] = None  # KMS key ID for encryption (optional)
-    variables: Optional[Dict[str, str]] = None  # Custom variables for transformation expansion
+    # Custom variables for transformation expansion (read-only mapping once constructed)
+    variables: Optional[Mapping[str, str]] = None
     filters: Optional[str] = None  # Filter secret name (maps patterns to transformations)
 
+    # Derived in __post_init__: True when replication assumes a role in another account
+    cross_account: bool = field(default=False, init=False, repr=False)
+
     def __post_init__(self):
         """Validate destination configuration"""
         if not self.region:
@@ -46,36 +84,42 @@ class DestinationConfig:
         if self.account_role_arn and not self.account_role_arn.startswith("arn:"):
             raise ConfigurationError(f"Invalid account_role_arn format: {self.account_role_arn}")
 
+        # Destinations commonly repeat regions and role ARNs; share one string per value
+        object.__setattr__(self, "region", sys.intern(self.region))
+        if self.account_role_arn:
+            object.__setattr__(self, "account_role_arn", sys.intern(self.account_role_arn))
+            object.__setattr__(self, "cross_account", True)
+
+        # Cached destinations are shared across invocations, so variables must not
+        # be mutable; names repeat across destinations and are interned like regions
+        if self.variables is not None:
+            object.__setattr__(
+                self,
+                "variables",
+                MappingProxyType({sys.intern(k): v for k, v in self.variables.items()}),
+            )
+
     @staticmethod
     def _is_valid_region(region: str) -> bool:
         """Basic validation for AWS region format"""
-        if not region:
-            return False
-
-        parts = region.split("-")
-        if len(parts) < 3:
-            return False
-
-        valid_prefixes = ["us", "eu", "ap", "ca", "sa", "af", "me", "il", "cn", "us-gov"]
-
-        region_prefix = parts[0] if parts[0] != "us" else f"{parts[0]}-{parts[1]}"
-        if region_prefix == "us-gov":
-            return len(parts) >= 3
+        # At least three dash-separated parts (us-east-1, us-gov-west-1, ...);
+        # GovCloud regions share the "us" partition prefix
+        parts = region.split("-", 2)
+        return len(parts) == 3 and parts[0] in VALID_REGION_PREFIXES
 
-        return parts[0] in valid_prefixes or region_prefix in valid_prefixes
 
-
-@dataclass
+@dataclass(slots=True)
 class ReplicatorConfig:
     """Configuration for the secrets replicator Lambda function"""
 
     # Destination configuration - supports multiple destinations
-    destinations: List[DestinationConfig]  # List of replication destinations
+    destinations: Sequence[DestinationConfig]  # Replication destinations (tuple once loaded)
 
     # Optional fields
     transform_mode: str = "auto"  # Transformation mode (auto|sed|json)
     log_level: str = "INFO"  # Log level
     enable_metrics: bool = True  # Enable CloudWatch metrics
+    keep_full_event_payload: bool = False  # Keep full CloudTrail payloads on parsed events
     dlq_arn: Optional[str] = None  # Dead Letter Queue ARN
 
     # SECRETS_FILTER configuration
@@ -123,23 +167,21 @@ class ReplicatorConfig:
                     )
 
         # Validate transform mode
-        valid_modes = ["auto", "sed", "json"]
-        if self.transform_mode not in valid_modes:
+        if self.transform_mode not in VALID_TRANSFORM_MODES:
             raise ConfigurationError(
-                f"Invalid transform_mode: {self.transform_mode} (must be one of {valid_modes})"
+                f"Invalid transform_mode: {self.transform_mode} "
+                f"(must be one of {sorted(VALID_TRANSFORM_MODES)})"
             )
 
-        # Validate log level
-        valid_log_levels = ["DEBUG", "INFO", "WARN", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_log_levels:
+        # Validate and normalize log level; mixed case like "dEbUg" takes the slow path
+        log_level = LOG_LEVEL_CANONICAL.get(self.log_level) or LOG_LEVEL_CANONICAL.get(
+            self.log_level.upper()
+        )
+        if log_level is None:
             raise ConfigurationError(
-                f"Invalid log_level: {self.log_level} (must be one of {valid_log_levels})"
+                f"Invalid log_level: {self.log_level} (must be one of {sorted(VALID_LOG_LEVELS)})"
             )
-
-        # Normalize log level to uppercase
-        self.log_level = self.log_level.upper()
-        if self.log_level == "WARN":
-            self.log_level = "WARNING"  # Normalize to Python logging standard
+        self.log_level = log_level
 
         # Validate DLQ ARN format (basic check)
         if self.dlq_arn and not self.dlq_arn.startswith("arn:"):
@@ -183,12 +225,13 @@ def parse_tag_filters(tag_string: str) -> List[tuple[str, str]]:
         if not tag:
             continue
 
-        if "=" not in tag:
+        key, sep, value = tag.partition("=")
+        if not sep:
             raise ConfigurationError(f"Invalid tag filter format: '{tag}' (expected Key=Value)")
 
-        key, value = tag.split("=", 1)
-        key = key.strip()
-        value = value.strip()
+        # Outer whitespace is already gone; only the edges around '=' remain
+        key = key.rstrip()
+        value = value.lstrip()
 
         if not key or not value:
             raise ConfigurationError(f"Invalid tag filter: '{tag}' (key and value cannot be empty)")
@@ -198,13 +241,17 @@ def parse_tag_filters(tag_string: str) -> List[tuple[str, str]]:
     return tags
 
 
-def load_config_from_env() -> ReplicatorConfig:
+def load_config_from_env(env: Optional[Mapping[str, str]] = None) -> ReplicatorConfig:
     """
     Load configuration from environment variables.
 
     Note: destinations list is initially empty and must be loaded via
     load_destinations() after creating a Secrets Manager client.
 
+    The process environment is parsed once per container; each call returns a
+    new ReplicatorConfig, so per-invocation mutation does not leak between calls.
+    Use clear_config_cache() to re-read changed environment variables.
+
     Environment variables:
         CONFIG_SECRET: Name of Secrets Manager secret containing configuration
             (default: 'secrets-replicator/config/destinations')
@@ -219,11 +266,17 @@ def load_config_from_env() -> ReplicatorConfig:
         KMS_KEY_ID: Default KMS key ID for destination encryption
         TRANSFORM_MODE: Transformation mode (default: 'auto')
         LOG_LEVEL: Log level (default: 'INFO')
-        ENABLE_METRICS: Enable CloudWatch metrics (default: 'true')
+        ENABLE_METRICS: Enable CloudWatch metrics (default: 'true'; any of
+            TRUTHY_ENV_VALUES enables, anything else disables)
         DLQ_ARN: Dead Letter Queue ARN
+        KEEP_FULL_EVENT_PAYLOAD: Keep full CloudTrail requestParameters/responseElements
+            on parsed events, for debugging (default: 'false')
         TIMEOUT_SECONDS: Regex timeout (default: 5)
         MAX_SECRET_SIZE: Maximum secret size (default: 65536)
 
+    Args:
+        env: Mapping to read instead of os.environ (parsed on every call, not cached)
+
     Returns:
         ReplicatorConfig object with empty destinations list
 
@@ -231,68 +284,132 @@ def load_config_from_env() -> ReplicatorConfig:
         ConfigurationError: If configuration is invalid
 
     Examples:
-        >>> import os
-        >>> os.environ['CONFIG_SECRET'] = 'my-app/config/destinations'
-        >>> config = load_config_from_env()
+        >>> load_config_from_env({'TRANSFORM_MODE': 'json'}).transform_mode
+        'json'
+        >>> config = load_config_from_env({'CONFIG_SECRET': 'my-app/config/destinations'})
         >>> config.config_secret
         'my-app/config/destinations'
+        >>> # os.environ is read once per container; re-read it after changing it
+        >>> os.environ['CONFIG_SECRET'] = 'other-app/config/destinations'
+        >>> clear_config_cache()
+        >>> load_config_from_env().config_secret
+        'other-app/config/destinations'
     """
-    # Get configuration secret name (defaults to hardcoded value)
-    config_secret = os.environ.get("CONFIG_SECRET", "").strip() or DEFAULT_DESTINATIONS_SECRET
+    settings = _read_env_settings() if env is None else _parse_env_settings(env)
+    return ReplicatorConfig(
+        destinations=[],  # Empty - must be loaded via load_destinations()
+        **settings,
+    )
 
-    # Default values for destination configurations
-    default_secret_names = os.environ.get("DEFAULT_SECRET_NAMES", "").strip() or None
-    default_region = os.environ.get("DEFAULT_REGION", "").strip() or None
-    default_role_arn = os.environ.get("DEFAULT_ROLE_ARN", "").strip() or None
-    secret_names_cache_ttl = int(os.environ.get("SECRET_NAMES_CACHE_TTL", "300"))
-    default_kms_key_id = os.environ.get("KMS_KEY_ID", "").strip() or None
 
-    # SECRETS_FILTER configuration
-    secrets_filter = os.environ.get("SECRETS_FILTER", "").strip() or None
-    secrets_filter_cache_ttl = int(os.environ.get("SECRETS_FILTER_CACHE_TTL", "300"))
+# Parsed destinations per config secret, keyed on the secret version they came from
+# (persists across Lambda invocations)
+_destinations_cache: Dict[str, Tuple[str, Tuple[DestinationConfig, ...]]] = {}
+
+
+@lru_cache(maxsize=1)
+def _read_env_settings() -> Dict[str, Any]:
+    """
+    Parse os.environ, caching the result.
+
+    Environment variables do not change for the life of a Lambda container, so
+    the parsed values are cached and reused by every invocation. Callers must
+    treat the returned dict as read-only.
+    """
+    return _parse_env_settings(os.environ)
+
+
+def _env_str(raw: Optional[str], default: str) -> str:
+    """Whitespace-stripped value, or the default when unset"""
+    return (default if raw is None else raw).strip()
 
+
+def _env_optional_str(raw: Optional[str], default: Optional[str]) -> Optional[str]:
+    """Whitespace-stripped value, or the default when unset, empty or blank"""
+    if raw is None:
+        return default
+    return raw.strip() or default
+
+
+def _env_int(raw: Optional[str], default: int) -> int:
+    """Integer value, or the default when unset"""
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError("expected an integer") from None
+
+
+def _env_bool(raw: Optional[str], default: bool) -> bool:
+    """True for any of TRUTHY_ENV_VALUES (case-insensitive), or the default when unset"""
+    return default if raw is None else raw.strip().lower() in TRUTHY_ENV_VALUES
+
+
+class EnvSetting(NamedTuple):
+    """An environment variable read by load_config_from_env()"""
+
+    name: str
+    field_name: str  # ReplicatorConfig field
+    # Called as parse(raw, default) with raw None when unset; raises ValueError if invalid
+    parse: Callable[[Optional[str], Any], Any]
+    default: Any
+
+
+# Environment variables read by load_config_from_env()
+ENV_SETTINGS: Tuple[EnvSetting, ...] = (
+    EnvSetting("CONFIG_SECRET", "config_secret", _env_optional_str, DEFAULT_DESTINATIONS_SECRET),
+    # Default values for destination configurations
+    EnvSetting("DEFAULT_SECRET_NAMES", "default_secret_names", _env_optional_str, None),
+    EnvSetting("DEFAULT_REGION", "default_region", _env_optional_str, None),
+    EnvSetting("DEFAULT_ROLE_ARN", "default_role_arn", _env_optional_str, None),
+    EnvSetting("SECRET_NAMES_CACHE_TTL", "secret_names_cache_ttl", _env_int, 300),
+    EnvSetting("KMS_KEY_ID", "default_kms_key_id", _env_optional_str, None),
+    # SECRETS_FILTER configuration
+    EnvSetting("SECRETS_FILTER", "secrets_filter", _env_optional_str, None),
+    EnvSetting("SECRETS_FILTER_CACHE_TTL", "secrets_filter_cache_ttl", _env_int, 300),
     # Common parameters
-    transform_mode = os.environ.get("TRANSFORM_MODE", "auto").strip()
-    log_level = os.environ.get("LOG_LEVEL", "INFO").strip()
+    EnvSetting("TRANSFORM_MODE", "transform_mode", _env_str, "auto"),
+    EnvSetting("LOG_LEVEL", "log_level", _env_str, "INFO"),
+    EnvSetting("ENABLE_METRICS", "enable_metrics", _env_bool, True),
+    EnvSetting("DLQ_ARN", "dlq_arn", _env_optional_str, None),
+    EnvSetting("KEEP_FULL_EVENT_PAYLOAD", "keep_full_event_payload", _env_bool, False),
+    # Advanced options
+    EnvSetting("TIMEOUT_SECONDS", "timeout_seconds", _env_int, 5),
+    EnvSetting("MAX_SECRET_SIZE", "max_secret_size", _env_int, 65536),
+)
 
-    # Boolean field
-    enable_metrics_str = os.environ.get("ENABLE_METRICS", "true").strip().lower()
-    enable_metrics = enable_metrics_str in ("true", "1", "yes", "on")
 
-    # Optional ARNs
-    dlq_arn = os.environ.get("DLQ_ARN", "").strip() or None
+def _parse_env_settings(env: Mapping[str, str]) -> Dict[str, Any]:
+    """Parse ENV_SETTINGS from env into ReplicatorConfig keyword arguments"""
+    get = env.get
+    settings = {}
+    for name, field_name, parse, default in ENV_SETTINGS:
+        raw = get(name)
+        try:
+            settings[field_name] = parse(raw, default)
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid {name} value: {raw!r} ({e})") from None
+    return settings
 
-    # Numeric fields with defaults
-    timeout_seconds = int(os.environ.get("TIMEOUT_SECONDS", "5"))
-    max_secret_size = int(os.environ.get("MAX_SECRET_SIZE", "65536"))
 
-    config = ReplicatorConfig(
-        destinations=[],  # Empty - must be loaded via load_destinations()
-        transform_mode=transform_mode,
-        log_level=log_level,
-        enable_metrics=enable_metrics,
-        dlq_arn=dlq_arn,
-        secrets_filter=secrets_filter,
-        secrets_filter_cache_ttl=secrets_filter_cache_ttl,
-        timeout_seconds=timeout_seconds,
-        max_secret_size=max_secret_size,
-        default_secret_names=default_secret_names,
-        default_region=default_region,
-        default_role_arn=default_role_arn,
-        secret_names_cache_ttl=secret_names_cache_ttl,
-        default_kms_key_id=default_kms_key_id,
-        config_secret=config_secret,
-    )
+def clear_config_cache():
+    """
+    Clear the cached environment settings and parsed destinations.
 
-    return config
+    Useful for testing and forcing configuration to be re-read.
+    """
+    _read_env_settings.cache_clear()
+    _destinations_cache.clear()
 
 
 def load_destinations(config: ReplicatorConfig, secrets_manager_client) -> None:
     """
     Load destination configurations from Secrets Manager secret.
 
-    Updates config.destinations in-place by loading from the configured
-    destinations secret.
+    Replaces config.destinations with a tuple loaded from the configured
+    destinations secret. The secret is fetched on every call so changes apply
+    immediately; parsing is skipped when its version ID matches the last load.
 
     Args:
         config: ReplicatorConfig object to update
@@ -310,7 +427,11 @@ def load_destinations(config: ReplicatorConfig, secrets_manager_client) -> None:
     """
     try:
         response = secrets_manager_client.get_secret(secret_id=config.config_secret)
-        destinations_json = response.secret_string
+        # orjson decodes UTF-8 bytes directly, so binary secrets need no str round-trip
+        destinations_json = (
+            response.secret_string if response.secret_string is not None else response.secret_binary
+        )
+        version_id = response.version_id
     except Exception as e:
         error_msg = str(e)
         if "ResourceNotFoundException" in error_msg or "not found" in error_msg.lower():
@@ -323,10 +444,20 @@ def load_destinations(config: ReplicatorConfig, secrets_manager_client) -> None:
             f"Failed to load configuration secret '{config.config_secret}': {e}"
         )
 
+    # Reuse destinations parsed from the same secret version on an earlier invocation
+    cached = _destinations_cache.get(config.config_secret)
+    if cached is not None and version_id is not None and cached[0] == version_id:
+        config.destinations = cached[1]
+        return
+
+    # Imported here so modules that only need the constants above skip its
+    # datetime/uuid/zoneinfo import chain
+    import orjson
+
     # Parse JSON
     try:
-        destinations_data = json.loads(destinations_json)
-    except json.JSONDecodeError as e:
+        destinations_data = orjson.loads(destinations_json)
+    except orjson.JSONDecodeError as e:
         raise ConfigurationError(
             f"Invalid JSON in configuration secret '{config.config_secret}': {e}"
         )
@@ -357,18 +488,24 @@ def load_destinations(config: ReplicatorConfig, secrets_manager_client) -> None:
                     f"Destination {i}: 'variables' must be a JSON object (dict), got {type(variables).__name__}"
                 )
 
+            # One pass over the destination's keys. Null and empty-string values
+            # are dropped so the DestinationConfig defaults apply; an explicit
+            # secret_names_cache_ttl of 0 (caching disabled) is kept
+            aliased = {}
+            for key, value in dest_data.items():
+                name = DESTINATION_FIELD_ALIASES.get(key)
+                if name is None or value is None or value == "":
+                    continue
+                if key == name:
+                    aliased[name] = value
+                else:
+                    aliased.setdefault(name, value)
+
             dest = DestinationConfig(
                 region=dest_data.get("region", ""),
-                account_role_arn=dest_data.get("account_role_arn")
-                or dest_data.get("accountRoleArn"),
-                external_id=dest_data.get("external_id") or dest_data.get("externalId"),
-                secret_names=dest_data.get("secret_names") or dest_data.get("secretNames"),
-                secret_names_cache_ttl=dest_data.get("secret_names_cache_ttl")
-                or dest_data.get("secretNamesCacheTTL")
-                or 300,
-                kms_key_id=dest_data.get("kms_key_id") or dest_data.get("kmsKeyId"),
                 variables=variables,
                 filters=dest_data.get("filters"),
+                **aliased,
             )
             destinations.append(dest)
         except (TypeError, ConfigurationError) as e:
@@ -376,8 +513,13 @@ def load_destinations(config: ReplicatorConfig, secrets_manager_client) -> None:
                 f"Invalid destination {i} in secret '{config.config_secret}': {e}"
             )
 
+    # Loaded destinations are immutable, so the same tuple is shared with the cache
+    loaded = tuple(destinations)
+    if version_id is not None:
+        _destinations_cache[config.config_secret] = (version_id, loaded)
+
     # Update config in-place
-    config.destinations = destinations
+    config.destinations = loaded
 
 
 def is_cross_account(destination: DestinationConfig) -> bool:
@@ -401,4 +543,4 @@ def is_cross_account(destination: DestinationConfig) -> bool:
         >>> is_cross_account(dest)
         True
     """
-    return bool(destination.account_role_arn)
+    return destination.cross_account
@@ -6,10 +6,33 @@ as well as simplified manual trigger events for on-demand replication.
 """
 
 import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 
+# EventBridge detail-types accepted from Secrets Manager
+VALID_DETAIL_TYPES = frozenset({"AWS API Call via CloudTrail", "AWS Service Event"})
+
+# CloudTrail event names parse_eventbridge_event() accepts
+SUPPORTED_EVENT_NAMES = frozenset(
+    {
+        "PutSecretValue",
+        "UpdateSecret",
+        "ReplicateSecretToRegions",
+        "ReplicateSecretVersion",
+        "CreateSecret",
+    }
+)
+
+# Subset of SUPPORTED_EVENT_NAMES that triggers replication
+REPLICATION_TRIGGER_EVENTS = frozenset({"PutSecretValue", "UpdateSecret", "CreateSecret"})
+
+# Payload keys the parser reads; the only ones kept on SecretEvent unless include_raw is set
+REQUEST_PARAMETER_KEYS = ("secretId", "name", "versionId")
+RESPONSE_ELEMENT_KEYS = ("ARN", "aRN", "versionId", "VersionId")
+
 
 class EventParsingError(Exception):
     """Raised when event parsing fails"""
@@ -17,7 +40,7 @@ class EventParsingError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecretEvent:
     """Represents a parsed Secrets Manager event"""
 
@@ -30,11 +53,11 @@ class SecretEvent:
     event_time: datetime  # When the event occurred
     user_identity: Optional[str]  # Who triggered the event
     source_ip: Optional[str]  # Source IP address
-    request_parameters: Dict[str, Any]  # Full request parameters
-    response_elements: Dict[str, Any]  # Full response elements
+    request_parameters: Dict[str, Any]  # Request parameters (consumed keys unless include_raw)
+    response_elements: Dict[str, Any]  # Response elements (consumed keys unless include_raw)
 
 
-def parse_eventbridge_event(event: Dict[str, Any]) -> SecretEvent:
+def parse_eventbridge_event(event: Dict[str, Any], include_raw: bool = False) -> SecretEvent:
     """
     Parse EventBridge event from Secrets Manager CloudTrail integration.
 
@@ -69,6 +92,8 @@ def parse_eventbridge_event(event: Dict[str, Any]) -> SecretEvent:
 
     Args:
         event: EventBridge event dictionary
+        include_raw: Keep the full requestParameters/responseElements payloads on the
+            SecretEvent instead of only the keys the parser reads
 
     Returns:
         SecretEvent object with parsed event data
@@ -97,36 +122,44 @@ def parse_eventbridge_event(event: Dict[str, Any]) -> SecretEvent:
     if not isinstance(event, dict):
         raise EventParsingError("Event must be a dictionary")
 
+    # Unpack required top-level fields in one pass; a missing key fails here
+    try:
+        source = event["source"]
+        detail_type = event["detail-type"]
+        region = event["region"]
+        account_id = event["account"]
+        event_time_str = event["time"]
+        detail = event["detail"]
+    except KeyError as e:
+        raise EventParsingError(f"Missing required field: {e}") from None
+
     # Check source
-    source = event.get("source", "")
     if source != "aws.secretsmanager":
         raise EventParsingError(f"Invalid event source: '{source}' (expected 'aws.secretsmanager')")
 
-    # Check detail-type
-    detail_type = event.get("detail-type", "")
-    valid_detail_types = ["AWS API Call via CloudTrail", "AWS Service Event"]
-    if detail_type not in valid_detail_types:
+    # Check detail-type (type-checked first: the set lookup would hash a list or dict)
+    if not isinstance(detail_type, str) or detail_type not in VALID_DETAIL_TYPES:
         raise EventParsingError(
-            f"Invalid detail-type: '{detail_type}' (expected one of {valid_detail_types})"
+            f"Invalid detail-type: '{detail_type}' (expected one of {sorted(VALID_DETAIL_TYPES)})"
         )
 
-    # Extract top-level fields
-    region = event.get("region", "")
+    # Present but empty values are rejected too
     if not region:
         raise EventParsingError("Missing required field: 'region'")
 
-    account_id = event.get("account", "")
     if not account_id:
         raise EventParsingError("Missing required field: 'account'")
 
-    event_time_str = event.get("time", "")
+    # Interned so downstream dict keys and comparisons hit the identity fast path
+    region = sys.intern(str(region))
+    account_id = sys.intern(str(account_id))
+
     try:
-        event_time = datetime.fromisoformat(event_time_str.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
+        # Python 3.11+ parses the trailing "Z" natively, so no rewritten copy is needed
+        event_time = datetime.fromisoformat(event_time_str)
+    except (ValueError, TypeError):
         raise EventParsingError(f"Invalid event time format: '{event_time_str}'")
 
-    # Extract detail
-    detail = event.get("detail", {})
     if not isinstance(detail, dict):
         raise EventParsingError("Missing or invalid 'detail' field")
 
@@ -136,36 +169,29 @@ def parse_eventbridge_event(event: Dict[str, Any]) -> SecretEvent:
         raise EventParsingError("Missing required field: 'detail.eventName'")
 
     # Validate event name
-    valid_event_names = [
-        "PutSecretValue",
-        "UpdateSecret",
-        "ReplicateSecretToRegions",
-        "ReplicateSecretVersion",
-        "CreateSecret",
-    ]
-    if event_name not in valid_event_names:
+    if not isinstance(event_name, str) or event_name not in SUPPORTED_EVENT_NAMES:
         raise EventParsingError(
-            f"Unsupported event name: '{event_name}' (expected one of {valid_event_names})"
+            f"Unsupported event name: '{event_name}' "
+            f"(expected one of {sorted(SUPPORTED_EVENT_NAMES)})"
         )
+    event_name = sys.intern(event_name)
 
     # Extract request parameters
-    request_parameters = detail.get("requestParameters", {})
+    request_parameters = detail.get("requestParameters")
     if not isinstance(request_parameters, dict):
         request_parameters = {}
 
     # Extract response elements
-    response_elements = detail.get("responseElements", {})
+    response_elements = detail.get("responseElements")
     if not isinstance(response_elements, dict):
         response_elements = {}
 
+    # ARN from the response, looked up once for both secret ID and ARN below
+    response_arn = response_elements.get("ARN") or response_elements.get("aRN")  # CloudTrail quirk
+
     # Extract secret ID (can be in multiple places)
     # Priority: requestParameters.secretId, requestParameters.name, responseElements.ARN
-    secret_id = (
-        request_parameters.get("secretId")
-        or request_parameters.get("name")
-        or response_elements.get("ARN")
-        or response_elements.get("aRN")  # CloudTrail quirk
-    )
+    secret_id = request_parameters.get("secretId") or request_parameters.get("name") or response_arn
 
     if not secret_id:
         raise EventParsingError(
@@ -173,11 +199,7 @@ def parse_eventbridge_event(event: Dict[str, Any]) -> SecretEvent:
         )
 
     # Extract secret ARN (may be in response)
-    secret_arn = (
-        response_elements.get("ARN")
-        or response_elements.get("aRN")  # CloudTrail quirk
-        or (secret_id if secret_id.startswith("arn:") else None)
-    )
+    secret_arn = response_arn or (secret_id if secret_id.startswith("arn:") else None)
 
     # Extract version ID
     version_id = (
@@ -187,7 +209,7 @@ def parse_eventbridge_event(event: Dict[str, Any]) -> SecretEvent:
     )
 
     # Extract user identity
-    user_identity_dict = detail.get("userIdentity", {})
+    user_identity_dict = detail.get("userIdentity")
     if isinstance(user_identity_dict, dict):
         user_identity = (
             user_identity_dict.get("principalId")
@@ -200,6 +222,17 @@ def parse_eventbridge_event(event: Dict[str, Any]) -> SecretEvent:
     # Extract source IP
     source_ip = detail.get("sourceIPAddress")
 
+    # Don't hold on to the rest of the CloudTrail payload after parsing
+    if not include_raw:
+        request_parameters = {
+            key: request_parameters[key]
+            for key in REQUEST_PARAMETER_KEYS
+            if key in request_parameters
+        }
+        response_elements = {
+            key: response_elements[key] for key in RESPONSE_ELEMENT_KEYS if key in response_elements
+        }
+
     return SecretEvent(
         event_name=event_name,
         secret_id=secret_id,
@@ -248,9 +281,7 @@ def validate_event_for_replication(event: SecretEvent) -> bool:
         True
     """
     # Check event name
-    replication_trigger_events = ["PutSecretValue", "UpdateSecret", "CreateSecret"]
-
-    if event.event_name not in replication_trigger_events:
+    if event.event_name not in REPLICATION_TRIGGER_EVENTS:
         return False
 
     # Check required fields
@@ -263,12 +294,15 @@ def validate_event_for_replication(event: SecretEvent) -> bool:
     return True
 
 
+@lru_cache(maxsize=4096)
 def extract_secret_name_from_arn(arn: str) -> Optional[str]:
     """
     Extract secret name from ARN.
 
     ARN format: arn:aws:secretsmanager:region:account:secret:name-suffix
 
+    The same ARNs recur across events for a secret, so results are memoized.
+
     Args:
         arn: Secret ARN
 
@@ -284,26 +318,20 @@ def extract_secret_name_from_arn(arn: str) -> Optional[str]:
     if not arn or not arn.startswith("arn:"):
         return None
 
-    try:
-        parts = arn.split(":")
-        if len(parts) < 7:
+    # Secret name starts after the sixth colon (and may itself contain colons)
+    name_start = 0
+    for _ in range(6):
+        name_start = arn.find(":", name_start) + 1
+        if not name_start:
             return None
 
-        # Secret name is in parts[6] and onwards
-        secret_part = ":".join(parts[6:])
+    # Remove the 6-character suffix that AWS adds
+    # Format: secret-name-XXXXXX where X is alphanumeric
+    dash = arn.rfind("-", name_start)
+    if dash != -1 and len(arn) - dash == 7:
+        return arn[name_start:dash]
 
-        # Remove the 6-character suffix that AWS adds
-        # Format: secret-name-XXXXXX where X is alphanumeric
-        if "-" in secret_part:
-            # Split and check if last part is 6 characters (likely suffix)
-            name_parts = secret_part.rsplit("-", 1)
-            if len(name_parts) == 2 and len(name_parts[1]) == 6:
-                return name_parts[0]
-
-        return secret_part
-
-    except (IndexError, AttributeError):
-        return None
+    return arn[name_start:]
 
 
 # =============================================================================
@@ -377,13 +405,14 @@ def parse_manual_event(event: Dict[str, Any], account_id: str = "") -> List[Secr
         raise EventParsingError("Event is not a manual trigger (source != 'manual')")
 
     # Extract secret IDs - support both singular and plural forms
-    secret_ids = []
+    # (dict keys keep first-seen order and drop duplicates in the same pass)
+    secret_ids: Dict[str, None] = {}
 
     if "secretId" in event:
         # Single secret
         secret_id = event["secretId"]
         if isinstance(secret_id, str) and secret_id.strip():
-            secret_ids.append(secret_id.strip())
+            secret_ids[secret_id.strip()] = None
         else:
             raise EventParsingError("'secretId' must be a non-empty string")
 
@@ -393,7 +422,7 @@ def parse_manual_event(event: Dict[str, Any], account_id: str = "") -> List[Secr
         if isinstance(ids, list):
             for sid in ids:
                 if isinstance(sid, str) and sid.strip():
-                    secret_ids.append(sid.strip())
+                    secret_ids[sid.strip()] = None
                 else:
                     raise EventParsingError("Each item in 'secretIds' must be a non-empty string")
         else:
@@ -402,14 +431,6 @@ def parse_manual_event(event: Dict[str, Any], account_id: str = "") -> List[Secr
     if not secret_ids:
         raise EventParsingError("Manual trigger requires 'secretId' or 'secretIds'")
 
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_secret_ids = []
-    for sid in secret_ids:
-        if sid not in seen:
-            seen.add(sid)
-            unique_secret_ids.append(sid)
-
     # Extract region - use event value, env var, or default
     region = event.get("region", "")
     if not region:
@@ -428,7 +449,7 @@ def parse_manual_event(event: Dict[str, Any], account_id: str = "") -> List[Secr
 
     # Create SecretEvent for each secret
     events = []
-    for secret_id in unique_secret_ids:
+    for secret_id in secret_ids:
         # Determine if secret_id is an ARN
         secret_arn = secret_id if secret_id.startswith("arn:") else None
 
@@ -8,27 +8,194 @@ Filters serve a dual purpose:
 Handles loading, caching, and pattern matching for SECRETS_FILTER configuration.
 """
 
-import json
 import logging
 import re
+import sys
+import threading
 import time
-from typing import Dict, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from botocore.exceptions import ClientError
 
-from config import TRANSFORMATION_SECRET_PREFIX, FILTER_SECRET_PREFIX
+from config import TRANSFORMATION_SECRET_PREFIX, FILTER_SECRET_PREFIX, NAME_MAPPING_PREFIX
 
 logger = logging.getLogger(__name__)
 
+# Replicator configuration secrets, never replicated themselves (checked in one startswith call)
+SYSTEM_SECRET_PREFIXES = (
+    TRANSFORMATION_SECRET_PREFIX,
+    FILTER_SECRET_PREFIX,
+    "secrets-replicator/config/",
+    NAME_MAPPING_PREFIX,
+)
+
 
 # Global cache for filter configuration (persists across Lambda invocations)
-_filter_cache = {
-    "data": None,  # Dict[str, Optional[str]] - merged filters
+_filter_cache: Dict[str, Any] = {
+    "data": None,  # CompiledFilters - merged filters
     "loaded_at": 0,  # float - timestamp
     "ttl": 300,  # int - cache TTL in seconds
     "source_list": None,  # str - comma-separated filter secret names
 }
 
+# Upper bound on concurrent GetSecretValue calls when loading several filter secrets
+FILTER_FETCH_MAX_WORKERS = 8
+
+# Wildcard buckets larger than this are scanned pattern by pattern instead of through
+# one combined alternation regex, keeping each compiled regex within sane size limits
+COMBINED_REGEX_MAX_PATTERNS = 1000
+
+# Serializes cache misses so concurrent callers load the filters once (hits never lock).
+# The cache dict is replaced whole, never mutated, so lock-free readers see a consistent entry.
+_filter_cache_lock = threading.Lock()
+
+# Parsed filter secret contents, keyed on the secret version they came from
+# (persists across Lambda invocations)
+_filter_data_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+
+class _WildcardEntry(NamedTuple):
+    """A wildcard pattern as indexed by CompiledFilters"""
+
+    order: int  # Position in filter order; lower wins
+    pattern: str
+    matcher: Callable[[str], Any]
+    transform: Optional[str]
+
+
+# Entries in filter order, plus their combined alternation regex (None: scan entries)
+_Bucket = Tuple[List[_WildcardEntry], Optional[re.Pattern]]
+
+
+class CompiledFilters(dict):
+    """
+    Merged filter dict with its wildcard patterns compiled once, in filter order.
+
+    Built by get_cached_filters() so find_matching_filter() can skip the per-call
+    "is wildcard?" scan and matcher construction. Wildcards are also indexed by their
+    literal leading path segments ("app/prod" for "app/prod/*", "team" for
+    "team/*/prod/*"), so a lookup only tries the patterns whose literal prefix is one
+    of the secret's own path prefixes, plus the patterns with a wildcard in their first
+    segment. Treat instances as read-only: the precompiled wildcards are not updated
+    if the dict is mutated.
+    """
+
+    __slots__ = ("wildcards", "_by_prefix", "_max_prefix_len", "_unbucketed")
+
+    def __init__(self, filters: Dict[str, Optional[str]]):
+        super().__init__(filters)
+        self.wildcards = _compile_wildcards(self)
+
+        # Each list in filter order
+        by_prefix: Dict[str, List[_WildcardEntry]] = {}
+        unbucketed: List[_WildcardEntry] = []
+        for index, (pattern, matcher, transform_name) in enumerate(self.wildcards):
+            entry = _WildcardEntry(index, pattern, matcher, transform_name)
+            cut = pattern.rfind("/", 0, pattern.index("*"))
+            if cut == -1:
+                unbucketed.append(entry)
+            else:
+                by_prefix.setdefault(pattern[:cut], []).append(entry)
+
+        self._by_prefix = {prefix: _bucket(entries) for prefix, entries in by_prefix.items()}
+        self._max_prefix_len = max(map(len, by_prefix), default=-1)
+        self._unbucketed = _bucket(unbucketed)
+
+    def match_wildcard(self, secret_name: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Find the first wildcard pattern (in filter order) matching a secret name.
+
+        Returns:
+            (pattern, transformation) of the match, or None if no wildcard matches
+        """
+        best: Optional[_WildcardEntry] = None
+
+        # Patterns indexed under "a/b" can only match names starting with "a/b/"
+        slash = secret_name.find("/")
+        while slash != -1 and slash <= self._max_prefix_len:
+            bucket = self._by_prefix.get(secret_name[:slash])
+            if bucket is not None:
+                best = _first_match(bucket, secret_name, best)
+            slash = secret_name.find("/", slash + 1)
+
+        best = _first_match(self._unbucketed, secret_name, best)
+        return (best.pattern, best.transform) if best is not None else None
+
+
+def _bucket(entries: List[_WildcardEntry]) -> _Bucket:
+    """
+    Pair bucket entries with one alternation regex over all of them, in filter order.
+
+    A single match() of "(p0$)|(p1$)|..." runs every pattern inside the regex engine
+    and reports the first matching one via lastindex, instead of one Python-level
+    call per pattern. Single-entry buckets keep their own (possibly startswith) matcher,
+    and buckets over COMBINED_REGEX_MAX_PATTERNS fall back to the per-pattern scan.
+    """
+    if not 2 <= len(entries) <= COMBINED_REGEX_MAX_PATTERNS:
+        return entries, None
+    try:
+        combined = re.compile("|".join(f"({_glob_regex(entry[1])}$)" for entry in entries))
+    except re.error:
+        return entries, None
+    return entries, combined
+
+
+def _first_match(
+    bucket: _Bucket, secret_name: str, best: Optional[_WildcardEntry]
+) -> Optional[_WildcardEntry]:
+    """First bucket entry matching secret_name that precedes best in filter order, else best."""
+    entries, combined = bucket
+    if combined is not None:
+        match = combined.match(secret_name)
+        if match is None:
+            return best
+        # Every alternative is one capturing group, so a match always sets lastindex
+        assert match.lastindex is not None
+        entry = entries[match.lastindex - 1]
+        return entry if best is None or entry.order < best.order else best
+
+    for entry in entries:
+        if best is not None and entry.order > best.order:
+            break
+        if entry.matcher(secret_name):
+            return entry
+    return best
+
+
+def _compile_wildcards(
+    filters: Dict[str, Optional[str]],
+) -> Tuple[Tuple[str, Callable[[str], Any], Optional[str]], ...]:
+    """(pattern, matcher, transformation) for each valid wildcard pattern, in order"""
+    return tuple(
+        (pattern, matcher, transform_name)
+        for pattern, transform_name in filters.items()
+        if "*" in pattern and (matcher := _glob_matcher(pattern)) is not None
+    )
+
+
+def _glob_matcher(pattern: str) -> Optional[Callable[[str], Any]]:
+    """
+    Build a match function for a wildcard pattern.
+
+    "prefix/*" and "*/suffix" patterns (the common shapes) use str.startswith /
+    str.endswith; anything else falls back to the compiled regex.
+
+    Returns:
+        Callable returning a truthy value on match, or None if the pattern is invalid
+    """
+    if pattern.count("*") == 1:
+        if pattern.endswith("*"):
+            prefix = pattern[:-1]
+            return lambda secret_name: secret_name.startswith(prefix)
+        if pattern.startswith("*"):
+            suffix = pattern[1:]
+            return lambda secret_name: secret_name.endswith(suffix)
+
+    compiled_pattern = _compile_glob(pattern)
+    return compiled_pattern.match if compiled_pattern is not None else None
+
 
 def load_filter_configuration(filter_list: str, client) -> Dict[str, Optional[str]]:
     """
@@ -65,53 +232,86 @@ def load_filter_configuration(filter_list: str, client) -> Dict[str, Optional[st
         return {}
 
     merged_filters = {}
-    filter_secrets = [s.strip() for s in filter_list.split(",") if s.strip()]
+    filter_secrets = [name for s in filter_list.split(",") if (name := s.strip())]
+    if not filter_secrets:
+        logger.info("Filter list contains no secret names, returning empty filters")
+        return {}
+
+    logger.info("Loading %s filter secrets", len(filter_secrets))
 
-    logger.info(f"Loading {len(filter_secrets)} filter secrets")
+    import orjson
 
-    for secret_name in filter_secrets:
+    # Fetch all filter secrets concurrently (one round-trip of latency instead of one per
+    # secret); results are merged below in list order so later filters still override.
+    # Each fetch is a callable returning the response, so errors surface inside the loop.
+    if len(filter_secrets) == 1:
+        fetches: List[Callable[[], Any]] = [partial(client.get_secret, secret_id=filter_secrets[0])]
+    else:
+        workers = min(len(filter_secrets), FILTER_FETCH_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetches = [
+                executor.submit(client.get_secret, secret_id=name).result for name in filter_secrets
+            ]
+
+    for secret_name, fetch in zip(filter_secrets, fetches):
         try:
-            logger.debug(f"Loading filter secret: {secret_name}")
-            response = client.get_secret(secret_id=secret_name)
-
-            # Parse JSON
-            try:
-                filter_data = json.loads(response.secret_string)
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in filter secret {secret_name}: {e}")
-                raise ValueError(f"Filter secret {secret_name} contains invalid JSON: {e}")
-
-            # Validate filter data is a dict
-            if not isinstance(filter_data, dict):
-                logger.error(
-                    f"Filter secret {secret_name} must be a JSON object, got {type(filter_data)}"
-                )
-                raise ValueError(f"Filter secret {secret_name} must be a JSON object")
+            logger.debug("Loading filter secret: %s", secret_name)
+            response = fetch()
+            version_id = response.version_id
+
+            # Reuse the parse from an earlier TTL window if the secret version is unchanged
+            cached = _filter_data_cache.get(secret_name)
+            if cached is not None and version_id is not None and cached[0] == version_id:
+                filter_data = cached[1]
+            else:
+                # Parse JSON
+                try:
+                    filter_data = orjson.loads(response.secret_string)
+                except orjson.JSONDecodeError as e:
+                    logger.error("Invalid JSON in filter secret %s: %s", secret_name, e)
+                    raise ValueError(f"Filter secret {secret_name} contains invalid JSON: {e}")
+
+                # Validate filter data is a dict
+                if not isinstance(filter_data, dict):
+                    logger.error(
+                        "Filter secret %s must be a JSON object, got %s",
+                        secret_name,
+                        type(filter_data),
+                    )
+                    raise ValueError(f"Filter secret {secret_name} must be a JSON object")
+
+                if version_id is not None:
+                    _filter_data_cache[secret_name] = (version_id, filter_data)
 
             # Merge filters (later filters override earlier ones)
             for pattern, transform_name in filter_data.items():
                 # Normalize empty string and None to None
                 if transform_name == "" or transform_name is None:
                     merged_filters[pattern] = None
-                    logger.debug(f"Filter pattern '{pattern}' -> no transformation")
+                    logger.debug("Filter pattern '%s' -> no transformation", pattern)
                 else:
+                    # Many patterns share a few transformation names; keep one copy of each
+                    if isinstance(transform_name, str):
+                        transform_name = sys.intern(transform_name)
                     merged_filters[pattern] = transform_name
-                    logger.debug(f"Filter pattern '{pattern}' -> transformation '{transform_name}'")
+                    logger.debug(
+                        "Filter pattern '%s' -> transformation '%s'", pattern, transform_name
+                    )
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            logger.error(f"Failed to load filter secret {secret_name}: {error_code} - {e}")
+            logger.error("Failed to load filter secret %s: %s - %s", secret_name, error_code, e)
             # Continue with other filters rather than failing completely
             continue
         except Exception as e:
             logger.error(
-                f"Unexpected error loading filter secret {secret_name}: {e}", exc_info=True
+                "Unexpected error loading filter secret %s: %s", secret_name, e, exc_info=True
             )
             # Continue with other filters
             continue
 
     logger.info(
-        f"Loaded {len(merged_filters)} filter patterns from {len(filter_secrets)} filter secrets"
+        "Loaded %s filter patterns from %s filter secrets", len(merged_filters), len(filter_secrets)
     )
     return merged_filters
 
@@ -130,35 +330,46 @@ def get_cached_filters(filter_list: str, ttl: int, client) -> Dict[str, Optional
         client: Boto3 Secrets Manager client
 
     Returns:
-        Dict mapping secret patterns to transformation names
+        CompiledFilters dict mapping secret patterns to transformation names
     """
-    now = time.time()
-
-    # Check if cache is valid
-    cache_valid = (
-        _filter_cache["data"] is not None
-        and _filter_cache["source_list"] == filter_list
-        and (now - _filter_cache["loaded_at"]) < _filter_cache["ttl"]
-    )
+    global _filter_cache
 
-    if cache_valid:
+    filters = _valid_cached_filters(_filter_cache, filter_list)
+    if filters is not None:
         logger.debug("Using cached filter configuration")
-        return _filter_cache["data"]
+        return filters
+
+    with _filter_cache_lock:
+        # Another caller may have loaded the same filters while we waited
+        filters = _valid_cached_filters(_filter_cache, filter_list)
+        if filters is not None:
+            logger.debug("Using filter configuration loaded by a concurrent caller")
+            return filters
 
-    # Load fresh configuration
-    logger.info(f"Loading fresh filter configuration from: {filter_list}")
-    filters = load_filter_configuration(filter_list, client)
+        # Load fresh configuration, compiling wildcard patterns once for all lookups
+        logger.info("Loading fresh filter configuration from: %s", filter_list)
+        now = time.time()
+        filters = CompiledFilters(load_filter_configuration(filter_list, client))
 
-    # Update cache
-    _filter_cache["data"] = filters
-    _filter_cache["loaded_at"] = now
-    _filter_cache["ttl"] = ttl
-    _filter_cache["source_list"] = filter_list
+        # Update cache
+        _filter_cache = {"data": filters, "loaded_at": now, "ttl": ttl, "source_list": filter_list}
 
-    logger.info(f"Filter configuration cached (TTL: {ttl}s)")
+    logger.info("Filter configuration cached (TTL: %ss)", ttl)
     return filters
 
 
+def _valid_cached_filters(cache: Dict[str, Any], filter_list: str) -> Optional[CompiledFilters]:
+    """Return the cached filters if they were loaded from filter_list and are within TTL."""
+    data: Optional[CompiledFilters] = cache["data"]
+    if (
+        data is not None
+        and cache["source_list"] == filter_list
+        and (time.time() - cache["loaded_at"]) < cache["ttl"]
+    ):
+        return data
+    return None
+
+
 def match_secret_pattern(secret_name: str, pattern: str) -> bool:
     """
     Match a secret name against a glob pattern.
@@ -193,23 +404,32 @@ def match_secret_pattern(secret_name: str, pattern: str) -> bool:
     if "*" not in pattern:
         return secret_name == pattern
 
-    # Convert glob pattern to regex
-    # Escape special regex characters except *
-    escaped_pattern = re.escape(pattern)
+    compiled_pattern = _compile_glob(pattern)
+    return compiled_pattern is not None and compiled_pattern.match(secret_name) is not None
+
 
-    # Replace escaped \* with regex .*
-    regex_pattern = escaped_pattern.replace(r"\*", ".*")
+def _glob_regex(pattern: str) -> str:
+    """Unanchored regex source for a glob pattern."""
+    # Escape special regex characters except *, then replace escaped \* with .*
+    return re.escape(pattern).replace(r"\*", ".*")
 
-    # Anchor the pattern
-    regex_pattern = f"^{regex_pattern}$"
 
-    # Compile and match
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> Optional[re.Pattern]:
+    """
+    Compile a glob pattern to an anchored regex.
+
+    Filter patterns are reused for every secret and across warm invocations, so
+    the compiled regex is cached per pattern.
+
+    Returns:
+        Compiled pattern, or None if the generated regex is invalid
+    """
     try:
-        compiled_pattern = re.compile(regex_pattern)
-        return bool(compiled_pattern.match(secret_name))
+        return re.compile(f"^{_glob_regex(pattern)}$")
     except re.error as e:
-        logger.error(f"Invalid regex pattern generated from '{pattern}': {e}")
-        return False
+        logger.error("Invalid regex pattern generated from '%s': %s", pattern, e)
+        return None
 
 
 def find_matching_filter(
@@ -247,18 +467,23 @@ def find_matching_filter(
     """
     # Check exact match first (highest priority)
     if secret_name in filters:
-        logger.debug(f"Exact match found for '{secret_name}'")
+        logger.debug("Exact match found for '%s'", secret_name)
         return filters[secret_name]
 
-    # Check wildcard patterns
-    for pattern, transform_name in filters.items():
-        if "*" in pattern:
-            if match_secret_pattern(secret_name, pattern):
-                logger.debug(f"Pattern match: '{secret_name}' matches '{pattern}'")
+    # Check wildcard patterns (precompiled when the filters came from get_cached_filters)
+    if isinstance(filters, CompiledFilters):
+        match = filters.match_wildcard(secret_name)
+        if match is not None:
+            logger.debug("Pattern match: '%s' matches '%s'", secret_name, match[0])
+            return match[1]
+    else:
+        for pattern, matcher, transform_name in _compile_wildcards(filters):
+            if matcher(secret_name):
+                logger.debug("Pattern match: '%s' matches '%s'", secret_name, pattern)
                 return transform_name
 
     # No match found
-    logger.debug(f"No filter match for '{secret_name}'")
+    logger.debug("No filter match for '%s'", secret_name)
     return False
 
 
@@ -301,33 +526,20 @@ def should_replicate_secret(secret_name: str, config, client) -> Tuple[bool, Opt
         >>> should_replicate_secret("secrets-replicator/transformations/test", config, client)
         (False, None)
     """
-    # LAYER 1: Hardcoded exclusions for transformation and filter secrets
+    # LAYER 1: Hardcoded exclusions for transformation, filter, config and name mapping secrets
     # This prevents circular dependencies and accidental replication of configuration
-    if secret_name.startswith(TRANSFORMATION_SECRET_PREFIX):
-        logger.debug(f"Excluded: transformation secret (prefix: {TRANSFORMATION_SECRET_PREFIX})")
-        return (False, None)
-
-    if secret_name.startswith(FILTER_SECRET_PREFIX):
-        logger.debug(f"Excluded: filter secret (prefix: {FILTER_SECRET_PREFIX})")
-        return (False, None)
-
-    # Hardcoded exclusion for config secrets
-    if secret_name.startswith("secrets-replicator/config/"):
-        logger.debug(f"Excluded: config secret (prefix: secrets-replicator/config/)")
-        return (False, None)
-
-    if secret_name.startswith("secrets-replicator/names/"):
-        logger.debug(f"Excluded: name mapping secret (prefix: secrets-replicator/names/)")
+    if secret_name.startswith(SYSTEM_SECRET_PREFIXES):
+        logger.debug("Excluded: system secret '%s'", secret_name)
         return (False, None)
 
     # LAYER 2: Check SECRETS_FILTER configuration
-    secrets_filter = getattr(config, "secrets_filter", None)
-    secrets_filter_cache_ttl = getattr(config, "secrets_filter_cache_ttl", 300)
+    secrets_filter = config.secrets_filter
+    secrets_filter_cache_ttl = config.secrets_filter_cache_ttl
 
     # If SECRETS_FILTER not configured, allow all secrets with no transformation
     if not secrets_filter:
         logger.info(
-            f"SECRETS_FILTER not configured - allowing '{secret_name}' without transformation"
+            "SECRETS_FILTER not configured - allowing '%s' without transformation", secret_name
         )
         return (True, None)
 
@@ -335,13 +547,13 @@ def should_replicate_secret(secret_name: str, config, client) -> Tuple[bool, Opt
     try:
         filters = get_cached_filters(secrets_filter, secrets_filter_cache_ttl, client)
     except Exception as e:
-        logger.error(f"Failed to load filters from SECRETS_FILTER: {e}")
+        logger.error("Failed to load filters from SECRETS_FILTER: %s", e)
         # On filter load failure, deny replication for safety
         return (False, None)
 
     # If no filters loaded (empty or all failed), deny replication
     if not filters:
-        logger.warning(f"No filters loaded from SECRETS_FILTER - denying '{secret_name}'")
+        logger.warning("No filters loaded from SECRETS_FILTER - denying '%s'", secret_name)
         return (False, None)
 
     # Find matching filter pattern
@@ -350,17 +562,17 @@ def should_replicate_secret(secret_name: str, config, client) -> Tuple[bool, Opt
     if match_result is False:
         # No match found - deny replication
         logger.info(
-            f"Secret '{secret_name}' does not match any filter pattern - denying replication"
+            "Secret '%s' does not match any filter pattern - denying replication", secret_name
         )
         return (False, None)
 
     # Match found - match_result is either a transformation name (str) or None
     if match_result is None:
-        logger.info(f"Secret '{secret_name}' matched filter - replicating without transformation")
+        logger.info("Secret '%s' matched filter - replicating without transformation", secret_name)
         return (True, None)
     else:
         logger.info(
-            f"Secret '{secret_name}' matched filter - using transformation '{match_result}'"
+            "Secret '%s' matched filter - using transformation '%s'", secret_name, match_result
         )
         return (True, match_result)
 
@@ -384,17 +596,9 @@ def is_system_secret(secret_name: str) -> bool:
         >>> is_system_secret("app/prod/database")
         False
     """
-    system_prefixes = [
-        TRANSFORMATION_SECRET_PREFIX,
-        FILTER_SECRET_PREFIX,
-        "secrets-replicator/config/",
-        "secrets-replicator/names/",
-    ]
-
-    for prefix in system_prefixes:
-        if secret_name.startswith(prefix):
-            logger.debug(f"Secret '{secret_name}' is a system secret (prefix: {prefix})")
-            return True
+    if secret_name.startswith(SYSTEM_SECRET_PREFIXES):
+        logger.debug("Secret '%s' is a system secret", secret_name)
+        return True
 
     return False
 
@@ -415,8 +619,8 @@ def get_destination_transformation(
 
     Args:
         secret_name: Name of the secret being replicated
-        destination: DestinationConfig object (may have 'filters' field)
-        global_config: ReplicatorConfig object (has 'secrets_filter' field)
+        destination: DestinationConfig object ('filters' may be None)
+        global_config: ReplicatorConfig object (secrets_filter and secrets_filter_cache_ttl)
         client: Boto3 Secrets Manager client
 
     Returns:
@@ -439,17 +643,15 @@ def get_destination_transformation(
         (False, None)  # Do NOT replicate
     """
     # Get destination-specific filter or fall back to global
-    dest_filters = getattr(destination, "filters", None)
-    global_filters = getattr(global_config, "secrets_filter", None)
-    cache_ttl = getattr(global_config, "secrets_filter_cache_ttl", 300)
-
-    # Determine which filter to use
-    filter_secret = dest_filters or global_filters
+    filter_secret = destination.filters or global_config.secrets_filter
+    cache_ttl = global_config.secrets_filter_cache_ttl
 
     if not filter_secret:
         # No filters configured at all - allow secret, no transformation
         logger.info(
-            f"No filters configured for destination {destination.region} - allowing '{secret_name}'"
+            "No filters configured for destination %s - allowing '%s'",
+            destination.region,
+            secret_name,
         )
         return (True, None)
 
@@ -457,12 +659,12 @@ def get_destination_transformation(
     try:
         filters = get_cached_filters(filter_secret, cache_ttl, client)
     except Exception as e:
-        logger.error(f"Failed to load filters for destination {destination.region}: {e}")
+        logger.error("Failed to load filters for destination %s: %s", destination.region, e)
         return (False, None)
 
     if not filters:
         logger.warning(
-            f"No filters loaded for destination {destination.region} - denying '{secret_name}'"
+            "No filters loaded for destination %s - denying '%s'", destination.region, secret_name
         )
         return (False, None)
 
@@ -470,17 +672,20 @@ def get_destination_transformation(
     match_result = find_matching_filter(secret_name, filters)
 
     if match_result is False:
-        logger.info(f"Secret '{secret_name}' doesn't match filters for {destination.region}")
+        logger.info("Secret '%s' doesn't match filters for %s", secret_name, destination.region)
         return (False, None)
 
     if match_result is None:
         logger.info(
-            f"Secret '{secret_name}' matches filter for {destination.region} - no transformation"
+            "Secret '%s' matches filter for %s - no transformation", secret_name, destination.region
         )
         return (True, None)
 
     logger.info(
-        f"Secret '{secret_name}' matches filter for {destination.region} - transform: '{match_result}'"
+        "Secret '%s' matches filter for %s - transform: '%s'",
+        secret_name,
+        destination.region,
+        match_result,
     )
     return (True, match_result)
 
@@ -492,5 +697,8 @@ def clear_filter_cache():
     Useful for testing and forcing a cache refresh.
     """
     global _filter_cache
-    _filter_cache = {"data": None, "loaded_at": 0, "ttl": 300, "source_list": None}
+    # Wait for any in-flight load so it cannot republish filters after the clear
+    with _filter_cache_lock:
+        _filter_cache = {"data": None, "loaded_at": 0, "ttl": 300, "source_list": None}
+        _filter_data_cache.clear()
     logger.info("Filter cache cleared")
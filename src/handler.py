@@ -45,7 +45,7 @@ from logger import (
     log_error,
 )
 from utils import get_secret_metadata, is_binary_data
-from aws_clients import create_secrets_manager_client
+from aws_clients import create_secrets_manager_client, get_caller_account_id
 from exceptions import (
     SecretNotFoundError,
     AccessDeniedError,
@@ -97,7 +97,7 @@ def build_variable_context(
         "DEST_SECRET_NAME": dest_secret_name,
         "ACCOUNT_ID": (
             destination.account_role_arn.split(":")[4]
-            if destination.account_role_arn
+            if destination.cross_account
             else source_account_id
         ),
         "SOURCE_ACCOUNT_ID": source_account_id,
@@ -307,7 +307,7 @@ def process_single_secret(secret_event, config, logger, metrics, start_time) ->
             "INFO",
             f"Replicating to destination {dest_idx}/{len(config.destinations)}",
             dest_region=destination.region,
-            has_role_arn=bool(destination.account_role_arn),
+            has_role_arn=destination.cross_account,
         )
 
         try:
@@ -788,10 +788,7 @@ def handle_manual_sync(
         account_id = event.get("accountId", "")
         if not account_id:
             try:
-                import boto3
-
-                sts = boto3.client("sts")
-                account_id = sts.get_caller_identity()["Account"]
+                account_id = get_caller_account_id()
             except Exception:
                 account_id = ""  # Will proceed without it
 
@@ -957,7 +954,9 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
         # Parse EventBridge event
         try:
-            secret_event = parse_eventbridge_event(event)
+            secret_event = parse_eventbridge_event(
+                event, include_raw=config.keep_full_event_payload
+            )
             log_event(
                 logger,
                 "INFO",
@@ -5,7 +5,6 @@ Provides utilities for tracking operational metrics including success rates,
 durations, error counts, and retry statistics.
 """
 
-import boto3
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 from logger import get_logger
@@ -47,6 +46,9 @@ class MetricsPublisher:
 
         if enabled:
             try:
+                # Imported here so importing the handler does not load boto3
+                import boto3
+
                 self._client = boto3.client("cloudwatch")
             except Exception as e:
                 logger.warning(f"Failed to initialize CloudWatch client: {e}")
@@ -55,7 +55,7 @@ def load_name_mappings(mapping_list: str, client) -> Dict[str, str]:
         return {}
 
     merged_mappings = {}
-    mapping_secrets = [s.strip() for s in mapping_list.split(",") if s.strip()]
+    mapping_secrets = [name for s in mapping_list.split(",") if (name := s.strip())]
 
     logger.info(f"Loading {len(mapping_secrets)} name mapping secrets")
 
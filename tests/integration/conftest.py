@@ -22,6 +22,8 @@ import pytest
 import boto3
 from botocore.exceptions import ClientError
 
+from config import clear_config_cache
+
 
 def pytest_addoption(parser):
     """Add custom command-line options for integration tests."""
@@ -182,6 +184,14 @@ class SecretHelper:
         self.created_secrets.clear()
 
 
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """Re-read environment settings per test; tests change os.environ between handler calls."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
 @pytest.fixture
 def aws_region(request):
     """AWS region for tests."""
@@ -9,6 +9,9 @@ import pytest
 import boto3
 from moto import mock_aws
 
+from aws_clients import clear_client_cache
+from config import clear_config_cache
+
 
 @pytest.fixture(autouse=True)
 def aws_mock():
@@ -18,6 +21,10 @@ def aws_mock():
     This fixture uses autouse=True to automatically apply mocking to all tests
     in the tests/unit directory without requiring explicit fixture usage.
     """
+    # Shared STS client / cached credentials must not leak between mocks
+    clear_client_cache()
+    # Tests set environment variables per test; re-read them each time
+    clear_config_cache()
     with mock_aws():
         # Create default configuration secrets that handler tests expect
         _setup_default_secrets()
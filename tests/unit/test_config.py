@@ -2,6 +2,7 @@
 Unit tests for config module
 """
 
+import dataclasses
 import json
 import os
 from unittest.mock import MagicMock
@@ -10,6 +11,7 @@ from config import (
     ReplicatorConfig,
     DestinationConfig,
     ConfigurationError,
+    clear_config_cache,
     load_config_from_env,
     load_destinations,
 )
@@ -62,6 +64,11 @@ class TestDestinationConfig:
         with pytest.raises(ConfigurationError, match="Invalid destination region format"):
             DestinationConfig(region="invalid")
 
+    def test_destination_unknown_region_prefix(self):
+        """Test that a well-formed region with an unknown partition prefix is rejected"""
+        with pytest.raises(ConfigurationError, match="Invalid destination region format"):
+            DestinationConfig(region="xx-east-1")
+
     def test_destination_empty_region(self):
         """Test that empty region raises error"""
         with pytest.raises(ConfigurationError, match="Destination region is required"):
@@ -93,6 +100,53 @@ class TestDestinationConfig:
             dest = DestinationConfig(region=region)
             assert dest.region == region
 
+    def test_destination_strings_are_interned(self):
+        """Equal regions and role ARNs from separately parsed destinations share one object"""
+        arn = "arn:aws:iam::999:role/MyRole"
+        first = DestinationConfig(region="".join(["us-", "west-2"]), account_role_arn=arn[:])
+        second = DestinationConfig(
+            region="".join(["us-west", "-2"]), account_role_arn="".join([arn[:10], arn[10:]])
+        )
+        assert first.region is second.region
+        assert first.account_role_arn is second.account_role_arn
+
+    def test_destination_cross_account_flag(self):
+        """cross_account is derived once from account_role_arn and not accepted as input"""
+        assert DestinationConfig(region="us-west-2").cross_account is False
+        assert (
+            DestinationConfig(
+                region="us-west-2", account_role_arn="arn:aws:iam::999:role/MyRole"
+            ).cross_account
+            is True
+        )
+        with pytest.raises(TypeError):
+            DestinationConfig(region="us-west-2", cross_account=True)
+
+    def test_destination_variables_are_read_only(self):
+        """variables become an immutable view that no longer tracks the input dict"""
+        source = {"ENV": "prod"}
+        dest = DestinationConfig(region="us-west-2", variables=source)
+        source["ENV"] = "dev"
+
+        assert dest.variables == {"ENV": "prod"}
+        with pytest.raises(TypeError):
+            dest.variables["ENV"] = "staging"
+
+    def test_destination_is_slotted_and_immutable(self):
+        """Destinations carry no per-instance __dict__ and cannot be mutated after validation"""
+        dest = DestinationConfig(region="us-west-2")
+        assert not hasattr(dest, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            dest.region = "invalid"
+
+    def test_destinations_compare_by_value(self):
+        """Separately built destinations with the same fields are equal"""
+        assert DestinationConfig(region="us-west-2") == DestinationConfig(region="us-west-2")
+        assert DestinationConfig(region="us-west-2") != DestinationConfig(region="eu-west-1")
+        assert ReplicatorConfig(destinations=[DestinationConfig(region="us-west-2")]) == (
+            ReplicatorConfig(destinations=[DestinationConfig(region="us-west-2")])
+        )
+
 
 class TestReplicatorConfig:
     """Tests for ReplicatorConfig dataclass"""
@@ -179,6 +233,12 @@ class TestReplicatorConfig:
         config = ReplicatorConfig(destinations=[dest], log_level="WARN")
         assert config.log_level == "WARNING"
 
+    def test_config_lowercase_warn_normalized_to_warning(self):
+        """Test that lowercase and title-case warn also normalize to WARNING"""
+        dest = DestinationConfig(region="us-west-2")
+        for level in ["warn", "Warn"]:
+            assert ReplicatorConfig(destinations=[dest], log_level=level).log_level == "WARNING"
+
     def test_config_invalid_dlq_arn(self):
         """Test that invalid DLQ ARN raises error"""
         dest = DestinationConfig(region="us-west-2")
@@ -276,14 +336,16 @@ class TestLoadConfigFromEnv:
     def test_load_enable_metrics_variants(self, monkeypatch):
         """Test various enable_metrics boolean values"""
         # Test 'true' variants
-        for value in ["true", "True", "TRUE", "1", "yes", "YES", "on", "ON"]:
+        for value in ["true", "True", "TRUE", "1", "yes", "YES", "on", "ON", "t", "Y", "enabled"]:
             monkeypatch.setenv("ENABLE_METRICS", value)
+            clear_config_cache()
             config = load_config_from_env()
             assert config.enable_metrics is True, f"Failed for value: {value}"
 
         # Test 'false' variants
         for value in ["false", "False", "FALSE", "0", "no", "NO", "off", "OFF"]:
             monkeypatch.setenv("ENABLE_METRICS", value)
+            clear_config_cache()
             config = load_config_from_env()
             assert config.enable_metrics is False, f"Failed for value: {value}"
 
@@ -298,6 +360,62 @@ class TestLoadConfigFromEnv:
         assert config.max_secret_size == 10000
         assert config.secret_names_cache_ttl == 600
 
+    def test_load_non_numeric_value_raises_configuration_error(self):
+        """Test that a non-numeric numeric setting is reported as a ConfigurationError"""
+        with pytest.raises(
+            ConfigurationError,
+            match=r"Invalid TIMEOUT_SECONDS value: 'soon' \(expected an integer\)",
+        ):
+            load_config_from_env({"TIMEOUT_SECONDS": "soon"})
+
+    def test_parser_error_message_is_reported(self, monkeypatch):
+        """Test that each setting's parser supplies its own error message"""
+        import config
+
+        def parse_color(raw, default):
+            raise ValueError("expected a color")
+
+        monkeypatch.setattr(
+            config,
+            "ENV_SETTINGS",
+            config.ENV_SETTINGS + (config.EnvSetting("COLOR", "color", parse_color, None),),
+        )
+        with pytest.raises(
+            ConfigurationError, match=r"Invalid COLOR value: 'x' \(expected a color\)"
+        ):
+            config._parse_env_settings({"COLOR": "x"})
+
+    def test_keep_full_event_payload(self):
+        """Test KEEP_FULL_EVENT_PAYLOAD is off by default and parsed as a boolean"""
+        assert load_config_from_env({}).keep_full_event_payload is False
+        assert load_config_from_env({"KEEP_FULL_EVENT_PAYLOAD": "true"}).keep_full_event_payload
+
+    def test_load_from_explicit_mapping(self, monkeypatch):
+        """An explicit env mapping is parsed directly, bypassing os.environ and the cache"""
+        monkeypatch.setenv("TRANSFORM_MODE", "sed")
+
+        config = load_config_from_env({"TRANSFORM_MODE": "json", "TIMEOUT_SECONDS": "7"})
+        assert config.transform_mode == "json"
+        assert config.timeout_seconds == 7
+        assert config.log_level == "INFO"
+
+        assert load_config_from_env().transform_mode == "sed"
+
+    def test_env_parsed_once_until_cache_cleared(self, monkeypatch):
+        """Environment is read once per container; each call still gets a fresh config"""
+        monkeypatch.setenv("TRANSFORM_MODE", "json")
+        first = load_config_from_env()
+        first.destinations.append(DestinationConfig(region="us-west-2"))
+
+        monkeypatch.setenv("TRANSFORM_MODE", "sed")
+        second = load_config_from_env()
+        assert second is not first
+        assert second.destinations == []
+        assert second.transform_mode == "json"
+
+        clear_config_cache()
+        assert load_config_from_env().transform_mode == "sed"
+
 
 class TestLoadDestinations:
     """Tests for load_destinations parsing of the destinations config secret"""
@@ -347,6 +465,36 @@ class TestLoadDestinations:
 
         assert config.destinations[0].external_id == "camel-case-id"
 
+    def test_zero_cache_ttl_is_preserved(self):
+        """An explicit TTL of 0 disables caching instead of falling back to 300"""
+        config = ReplicatorConfig(destinations=[])
+        client = self._mock_client(
+            json.dumps(
+                [
+                    {"region": "us-west-2", "secret_names_cache_ttl": 0},
+                    {"region": "eu-west-1", "secretNamesCacheTTL": 0},
+                    {"region": "ap-south-1", "secret_names_cache_ttl": None},
+                ]
+            )
+        )
+
+        load_destinations(config, client)
+
+        assert [d.secret_names_cache_ttl for d in config.destinations] == [0, 0, 300]
+
+    def test_snake_case_wins_over_camel_case(self):
+        """snake_case takes precedence regardless of key order in the JSON object"""
+        config = ReplicatorConfig(destinations=[])
+        client = self._mock_client(
+            json.dumps(
+                [{"region": "us-west-2", "kmsKeyId": "alias/camel", "kms_key_id": "alias/snake"}]
+            )
+        )
+
+        load_destinations(config, client)
+
+        assert config.destinations[0].kms_key_id == "alias/snake"
+
     def test_external_id_absent_yields_none(self):
         """Destination without external_id leaves the field None (backwards-compatible)"""
         config = ReplicatorConfig(destinations=[])
@@ -356,6 +504,83 @@ class TestLoadDestinations:
 
         assert config.destinations[0].external_id is None
 
+    def test_parses_all_camel_case_aliases(self):
+        """Every camelCase alias maps onto its DestinationConfig field"""
+        config = ReplicatorConfig(destinations=[])
+        client = self._mock_client(
+            json.dumps(
+                [
+                    {
+                        "region": "us-west-2",
+                        "secretNames": "secrets-replicator/names/us-west-2",
+                        "secretNamesCacheTTL": 900,
+                        "kmsKeyId": "alias/dest-key",
+                    }
+                ]
+            )
+        )
+
+        load_destinations(config, client)
+
+        dest = config.destinations[0]
+        assert dest.secret_names == "secrets-replicator/names/us-west-2"
+        assert dest.secret_names_cache_ttl == 900
+        assert dest.kms_key_id == "alias/dest-key"
+
+    def test_same_version_reuses_parsed_destinations(self):
+        """An unchanged secret version skips re-parsing on the next load"""
+        client = MagicMock()
+        client.get_secret.return_value = MagicMock(
+            secret_string=json.dumps([{"region": "us-west-2"}]), version_id="v1"
+        )
+        first = ReplicatorConfig(destinations=[])
+        load_destinations(first, client)
+
+        client.get_secret.return_value = MagicMock(
+            secret_string="not parsed when version matches", version_id="v1"
+        )
+        second = ReplicatorConfig(destinations=[])
+        load_destinations(second, client)
+
+        assert second.destinations is first.destinations
+        assert isinstance(second.destinations, tuple)
+
+    def test_new_version_reparses_destinations(self):
+        """A rotated config secret version is parsed again"""
+        client = MagicMock()
+        client.get_secret.return_value = MagicMock(
+            secret_string=json.dumps([{"region": "us-west-2"}]), version_id="v1"
+        )
+        load_destinations(ReplicatorConfig(destinations=[]), client)
+
+        client.get_secret.return_value = MagicMock(
+            secret_string=json.dumps([{"region": "eu-west-1"}]), version_id="v2"
+        )
+        config = ReplicatorConfig(destinations=[])
+        load_destinations(config, client)
+
+        assert config.destinations[0].region == "eu-west-1"
+
+    def test_parses_binary_config_secret(self):
+        """A config secret stored as SecretBinary is decoded without a str round-trip"""
+        config = ReplicatorConfig(destinations=[])
+        client = MagicMock()
+        client.get_secret.return_value = MagicMock(
+            secret_string=None, secret_binary=b'[{"region": "us-west-2"}]', version_id=None
+        )
+
+        load_destinations(config, client)
+
+        assert config.destinations[0].region == "us-west-2"
+
+    def test_invalid_json_raises_configuration_error(self):
+        """Malformed destinations JSON surfaces as ConfigurationError"""
+        config = ReplicatorConfig(destinations=[])
+        client = self._mock_client('[{"region": "us-west-2"')
+
+        with pytest.raises(ConfigurationError, match="Invalid JSON in configuration secret"):
+            load_destinations(config, client)
+
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios"""
@@ -363,7 +588,7 @@ class TestEdgeCases:
     def test_config_log_level_case_insensitive(self):
         """Test log level accepts various cases"""
         dest = DestinationConfig(region="us-west-2")
-        for level in ["debug", "DEBUG", "Debug", "INFO", "info", "ERROR", "error"]:
+        for level in ["debug", "DEBUG", "Debug", "dEbUg", "INFO", "info", "ERROR", "error"]:
             config = ReplicatorConfig(destinations=[dest], log_level=level)
             assert config.log_level == level.upper()
 
@@ -0,0 +1,138 @@
+"""
+Unit tests for scripts/cost-calculator.py
+"""
+
+import importlib.util
+import itertools
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "scripts" / "cost-calculator.py"
+
+
+def _load_cost_calculator():
+    """Import the script as a module (its file name is not a valid module name)"""
+    spec = importlib.util.spec_from_file_location("cost_calculator", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+cost_calculator = _load_cost_calculator()
+CostCalculator = cost_calculator.CostCalculator
+COST_FIELDS = cost_calculator.COST_FIELDS
+
+REPLICATIONS = [0, 1, 150, 1000]
+SECRETS = [0, 10]
+MEMORY_MB = [128, 512, 10240]
+DURATION_SEC = [0.1, 3.0]
+
+
+class TestCalculateTotalCosts:
+    """Tests for the scalar cost calculation"""
+
+    def test_total_costs_follow_cost_fields(self):
+        """Test that line items come back in report order"""
+        costs = CostCalculator(1000, 10).calculate_total_costs()
+        assert tuple(costs) == COST_FIELDS
+
+    def test_section_costs_match_totals(self):
+        """Test that per-section methods agree with the total breakdown"""
+        calculator = CostCalculator(1000, 10, enable_metrics=False)
+        costs = calculator.calculate_total_costs()
+
+        assert calculator.calculate_lambda_costs()["lambda_total"] == costs["lambda_total"]
+        assert calculator.calculate_cloudwatch_costs()["cloudwatch_metrics"] == 0.0
+        assert calculator.calculate_eventbridge_costs() == costs["eventbridge"]
+        assert calculator.calculate_sqs_sns_costs()["sqs_dlq"] == 10 * CostCalculator.SQS_REQUESTS
+
+    def test_disabled_alarms_cost_nothing(self):
+        """Test that disabling alarms drops alarm and SNS costs"""
+        costs = CostCalculator(1000, 10, enable_alarms=False).calculate_total_costs()
+        assert costs["cloudwatch_alarms"] == 0.0
+        assert costs["sns_notifications"] == 0.0
+
+
+class TestSweep:
+    """Tests for the vectorized sweep"""
+
+    def test_sweep_matches_scalar_costs(self):
+        """Test that every grid point equals calculate_total_costs() for that scenario"""
+        np = pytest.importorskip("numpy")
+
+        for enable_metrics, enable_alarms in itertools.product([True, False], repeat=2):
+            grid = CostCalculator.sweep(
+                np.array(REPLICATIONS)[:, None, None, None],
+                np.array(SECRETS)[None, :, None, None],
+                np.array(MEMORY_MB)[None, None, :, None],
+                np.array(DURATION_SEC)[None, None, None, :],
+                enable_metrics,
+                enable_alarms,
+            )
+
+            for index in itertools.product(
+                *(range(len(axis)) for axis in (REPLICATIONS, SECRETS, MEMORY_MB, DURATION_SEC))
+            ):
+                r, s, m, d = index
+                expected = CostCalculator(
+                    REPLICATIONS[r],
+                    SECRETS[s],
+                    MEMORY_MB[m],
+                    DURATION_SEC[d],
+                    enable_metrics,
+                    enable_alarms,
+                ).calculate_total_costs()
+                for name in COST_FIELDS:
+                    assert grid[name][index] == pytest.approx(expected[name]), name
+
+    def test_sweep_returns_float_arrays_of_broadcast_shape(self):
+        """Test that scenario-independent items are broadcast too"""
+        np = pytest.importorskip("numpy")
+
+        grid = CostCalculator.sweep(np.array([1, 10])[:, None], 5, np.array([128, 256, 512]), 3.0)
+
+        assert set(grid) == set(COST_FIELDS)
+        for name in COST_FIELDS:
+            assert grid[name].shape == (2, 3)
+            assert grid[name].dtype == np.float64
+
+
+class TestEvaluateScenarios:
+    """Tests for packed Monte Carlo scenario evaluation"""
+
+    def test_rows_are_scenarios_and_columns_follow_cost_fields(self):
+        """Test the (N, len(COST_FIELDS)) layout against the scalar calculator"""
+        np = pytest.importorskip("numpy")
+
+        scenarios = [
+            (100, 1, 512, 3.0, True, True),
+            (1000, 10, 1024, 1.5, False, True),
+            (50000, 50, 128, 0.5, True, False),
+        ]
+        columns = [np.array(values) for values in zip(*scenarios)]
+
+        packed = CostCalculator.evaluate_scenarios(*columns)
+
+        assert packed.shape == (len(scenarios), len(COST_FIELDS))
+        assert packed.dtype == np.float64
+        assert packed.flags["C_CONTIGUOUS"]
+        for row, scenario in zip(packed, scenarios):
+            expected = CostCalculator(*scenario).calculate_total_costs()
+            assert row.tolist() == pytest.approx([expected[name] for name in COST_FIELDS])
+
+    def test_scalar_flags_broadcast_across_scenarios(self):
+        """Test that enable flags may be given once for all scenarios"""
+        np = pytest.importorskip("numpy")
+
+        packed = CostCalculator.evaluate_scenarios(
+            np.array([100, 200]),
+            np.array([1, 2]),
+            np.array([512, 512]),
+            np.array([3.0, 3.0]),
+            False,
+            False,
+        )
+
+        alarms = COST_FIELDS.index("cloudwatch_alarms")
+        assert packed[:, alarms].tolist() == [0.0, 0.0]
@@ -2,8 +2,11 @@
 Unit tests for event_parser module
 """
 
+import dataclasses
+import pickle
+import sys
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from event_parser import (
     SecretEvent,
     parse_eventbridge_event,
@@ -159,6 +162,18 @@ class TestParseEventBridgeEvent:
         with pytest.raises(EventParsingError, match="Missing required field: 'account'"):
             parse_eventbridge_event(invalid_event)
 
+    def test_parse_invalid_event_missing_source(self):
+        """Test that a missing top-level key names the field"""
+        invalid_event = {
+            "detail-type": "AWS API Call via CloudTrail",
+            "region": "us-east-1",
+            "account": "123",
+            "time": "2025-01-01T12:00:00Z",
+            "detail": {"eventName": "PutSecretValue", "requestParameters": {"secretId": "test"}},
+        }
+        with pytest.raises(EventParsingError, match="Missing required field: 'source'"):
+            parse_eventbridge_event(invalid_event)
+
     def test_parse_invalid_event_time(self):
         """Test that invalid event time raises error"""
         invalid_event = {
@@ -172,6 +187,66 @@ class TestParseEventBridgeEvent:
         with pytest.raises(EventParsingError, match="Invalid event time format"):
             parse_eventbridge_event(invalid_event)
 
+    def test_parse_non_string_event_time(self):
+        """Test that a non-string event time raises error"""
+        invalid_event = {
+            "source": "aws.secretsmanager",
+            "detail-type": "AWS API Call via CloudTrail",
+            "region": "us-east-1",
+            "account": "123",
+            "time": 1735732800,
+            "detail": {"eventName": "PutSecretValue", "requestParameters": {"secretId": "test"}},
+        }
+        with pytest.raises(EventParsingError, match="Invalid event time format"):
+            parse_eventbridge_event(invalid_event)
+
+    def test_parse_event_time_is_utc(self):
+        """Test that a trailing Z parses as an aware UTC timestamp"""
+        event = {
+            "source": "aws.secretsmanager",
+            "detail-type": "AWS API Call via CloudTrail",
+            "region": "us-east-1",
+            "account": "123",
+            "time": "2025-01-01T12:00:00Z",
+            "detail": {"eventName": "PutSecretValue", "requestParameters": {"secretId": "test"}},
+        }
+        parsed = parse_eventbridge_event(event)
+        assert parsed.event_time == datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    def test_parse_event_interns_repeated_strings(self):
+        """Test that event name, region and account are interned"""
+        event = {
+            "source": "aws.secretsmanager",
+            "detail-type": "AWS API Call via CloudTrail",
+            "region": "".join(["us-east-", "1"]),
+            "account": "".join(["1234", "56789012"]),
+            "time": "2025-01-01T12:00:00Z",
+            "detail": {
+                "eventName": "".join(["PutSecret", "Value"]),
+                "requestParameters": {"secretId": "test"},
+            },
+        }
+        parsed = parse_eventbridge_event(event)
+        assert parsed.event_name is sys.intern("PutSecretValue")
+        assert parsed.region is sys.intern("us-east-1")
+        assert parsed.account_id is sys.intern("123456789012")
+
+    def test_parse_event_keeps_only_consumed_payload_keys(self):
+        """Test that unread CloudTrail payload keys are dropped by default"""
+        event = parse_eventbridge_event(PUT_SECRET_VALUE_EVENT)
+
+        assert event.request_parameters == {"secretId": "my-secret"}
+        assert "name" not in event.response_elements
+        assert event.response_elements["versionId"] == event.version_id
+
+    def test_parse_event_include_raw(self):
+        """Test that include_raw keeps the full CloudTrail payloads"""
+        event = parse_eventbridge_event(PUT_SECRET_VALUE_EVENT, include_raw=True)
+
+        detail = PUT_SECRET_VALUE_EVENT["detail"]
+        assert event.request_parameters == detail["requestParameters"]
+        assert event.response_elements == detail["responseElements"]
+
     def test_parse_event_not_dict(self):
         """Test that non-dict event raises error"""
         with pytest.raises(EventParsingError, match="Event must be a dictionary"):
@@ -190,6 +265,24 @@ class TestParseEventBridgeEvent:
         with pytest.raises(EventParsingError, match="Invalid detail-type"):
             parse_eventbridge_event(invalid_event)
 
+    def test_parse_event_unhashable_fields_raise_parsing_error(self):
+        """Test that list/dict detail-type or eventName raise EventParsingError, not TypeError"""
+        event = {
+            "source": "aws.secretsmanager",
+            "detail-type": ["AWS API Call via CloudTrail"],
+            "region": "us-east-1",
+            "account": "123",
+            "time": "2025-01-01T12:00:00Z",
+            "detail": {"eventName": "PutSecretValue", "requestParameters": {"secretId": "test"}},
+        }
+        with pytest.raises(EventParsingError, match="Invalid detail-type"):
+            parse_eventbridge_event(event)
+
+        event["detail-type"] = "AWS API Call via CloudTrail"
+        event["detail"]["eventName"] = {"a": 1}
+        with pytest.raises(EventParsingError, match="Unsupported event name"):
+            parse_eventbridge_event(event)
+
     def test_parse_event_extracts_version_id_from_request(self):
         """Test version ID extraction from requestParameters"""
         event_dict = {
@@ -293,6 +386,14 @@ class TestExtractSecretNameFromArn:
         name = extract_secret_name_from_arn(arn)
         assert name == "my-secret"
 
+    def test_extract_name_is_memoized(self):
+        """Test repeated ARNs are served from the cache"""
+        extract_secret_name_from_arn.cache_clear()
+        arn = "arn:aws:secretsmanager:us-east-1:123456789012:secret:my-secret-AbCdEf"
+
+        assert extract_secret_name_from_arn(arn) == extract_secret_name_from_arn(arn)
+        assert extract_secret_name_from_arn.cache_info().hits == 1
+
     def test_extract_name_from_arn_with_dashes(self):
         """Test extracting name from ARN with multiple dashes"""
         arn = "arn:aws:secretsmanager:us-east-1:123:secret:prod-db-password-XyZ123"
@@ -369,6 +470,20 @@ class TestSecretEvent:
         assert event.version_id is None
         assert event.user_identity is None
 
+    def test_secret_event_is_slotted(self):
+        """Test SecretEvent has no per-instance __dict__ and still pickles"""
+        event = parse_eventbridge_event(PUT_SECRET_VALUE_EVENT)
+
+        assert not hasattr(event, "__dict__")
+        assert pickle.loads(pickle.dumps(event)) == event
+
+    def test_secret_event_is_immutable(self):
+        """Test SecretEvent fields cannot be reassigned after parsing"""
+        event = parse_eventbridge_event(PUT_SECRET_VALUE_EVENT)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.secret_id = "other-secret"
+
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios"""
@@ -4,8 +4,13 @@ Tests for filtering logic with SECRETS_FILTER support.
 Tests the new centralized filter configuration system that replaces tag-based filtering.
 """
 
+import threading
+import time
+import orjson
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError
 from filters import (
     should_replicate_secret,
     load_filter_configuration,
@@ -13,6 +18,7 @@ from filters import (
     match_secret_pattern,
     find_matching_filter,
     clear_filter_cache,
+    CompiledFilters,
     is_system_secret,
     get_destination_transformation,
 )
@@ -95,6 +101,17 @@ class TestMatchSecretPattern:
         assert match_secret_pattern("app/team2/prod/cache", "app/*/prod/*") is True
         assert match_secret_pattern("app/team1/dev/db", "app/*/prod/*") is False
 
+    def test_regex_metacharacters_are_literal(self):
+        """Regex metacharacters in patterns match literally"""
+        assert match_secret_pattern("app.v1/prod", "app.v1/*") is True
+        assert match_secret_pattern("appXv1/prod", "app.v1/*") is False
+
+    def test_compiled_pattern_is_reused(self):
+        """Wildcard patterns are compiled once and reused across calls"""
+        from filters import _compile_glob
+
+        assert _compile_glob("app/*/db") is _compile_glob("app/*/db")
+
 
 class TestFindMatchingFilter:
     """Test filter pattern matching logic"""
@@ -110,6 +127,62 @@ class TestFindMatchingFilter:
         assert find_matching_filter("app/prod/api", filters) == "region-swap"
         assert find_matching_filter("db/mysql", filters) == "connection-transform"
 
+    def test_specialized_wildcards_keep_filter_order(self):
+        """Prefix, suffix and regex wildcards are tried in filter order"""
+        filters = CompiledFilters({"*/prod": "suffix", "app/*": "prefix", "*/db/*": "middle"})
+        assert find_matching_filter("app/prod", filters) == "suffix"
+        assert find_matching_filter("app/staging", filters) == "prefix"
+        assert find_matching_filter("x/db/y", filters) == "middle"
+        assert find_matching_filter("x/db", filters) is False
+
+    def test_bucketed_wildcards_respect_filter_order(self):
+        """An earlier unbucketed wildcard beats a later first-segment match, and vice versa"""
+        filters = CompiledFilters({"*/db": "any-db", "app/*": "app", "app/db": "exact"})
+        assert find_matching_filter("app/db", filters) == "exact"
+        assert find_matching_filter("team/db", filters) == "any-db"
+
+        filters = CompiledFilters({"app/*": "app", "*/db": "any-db"})
+        assert find_matching_filter("app/x/db", filters) == "app"
+        assert find_matching_filter("web/db", filters) == "any-db"
+
+        filters = CompiledFilters({"*/db": "any-db", "app/*": "app"})
+        assert find_matching_filter("app/db", filters) == "any-db"
+
+    def test_nested_prefix_buckets_respect_filter_order(self):
+        """Patterns indexed under nested literal prefixes still match in filter order"""
+        filters = CompiledFilters(
+            {"app/prod/*": "prod", "app/*": "app", "app/prod/db/*": "db", "*/db/*": "any"}
+        )
+        assert find_matching_filter("app/prod/db/main", filters) == "prod"
+        assert find_matching_filter("app/staging/db", filters) == "app"
+        assert find_matching_filter("web/db/main", filters) == "any"
+        assert find_matching_filter("app", filters) is False
+
+    def test_combined_bucket_regex_respects_filter_order(self):
+        """Buckets matched through one alternation regex report the earliest filter"""
+        filters = CompiledFilters(
+            {"*-svc": "svc", "*db*": "db", "*.prod": "prod", "app/*-svc": "app-svc", "app/*": "app"}
+        )
+        assert find_matching_filter("db-svc", filters) == "svc"
+        assert find_matching_filter("mydb.prod", filters) == "db"
+        assert find_matching_filter("web.prod", filters) == "prod"
+        assert find_matching_filter("app/api-svc", filters) == "svc"
+        assert find_matching_filter("app/api", filters) == "app"
+        assert find_matching_filter("web", filters) is False
+
+    def test_oversized_bucket_falls_back_to_pattern_scan(self, monkeypatch):
+        """Buckets over COMBINED_REGEX_MAX_PATTERNS are scanned per pattern, in filter order"""
+        import filters as filters_module
+
+        monkeypatch.setattr(filters_module, "COMBINED_REGEX_MAX_PATTERNS", 2)
+        filters = CompiledFilters({"*-svc": "svc", "*db*": "db", "*.prod": "prod"})
+
+        assert filters._unbucketed[1] is None
+        assert find_matching_filter("db-svc", filters) == "svc"
+        assert find_matching_filter("mydb.prod", filters) == "db"
+        assert find_matching_filter("web.prod", filters) == "prod"
+        assert find_matching_filter("web", filters) is False
+
     def test_no_match_returns_false(self):
         """No matching pattern returns False"""
         filters = {"app/*": "region-swap"}
@@ -143,10 +216,14 @@ class TestLoadFilterConfiguration:
     def test_load_multiple_filter_secrets(self):
         """Load and merge filters from multiple secrets"""
         mock_client = MagicMock()
-        mock_client.get_secret.side_effect = [
-            MagicMock(secret_string='{"app/*": "transform-a"}'),
-            MagicMock(secret_string='{"db/*": "transform-b", "app/*": "transform-c"}'),
-        ]
+        # Keyed by secret ID: filter secrets are fetched concurrently, in no fixed order
+        responses = {
+            "secrets-replicator/filters/a": MagicMock(secret_string='{"app/*": "transform-a"}'),
+            "secrets-replicator/filters/b": MagicMock(
+                secret_string='{"db/*": "transform-b", "app/*": "transform-c"}'
+            ),
+        }
+        mock_client.get_secret.side_effect = lambda secret_id: responses[secret_id]
 
         filters = load_filter_configuration(
             "secrets-replicator/filters/a,secrets-replicator/filters/b", mock_client
@@ -155,12 +232,52 @@ class TestLoadFilterConfiguration:
         # Later filter overrides earlier one for app/*
         assert filters == {"app/*": "transform-c", "db/*": "transform-b"}
 
+    def test_load_multiple_filter_secrets_concurrently(self):
+        """Filter secrets are fetched in parallel but merged in list order"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_secret(secret_id):
+            # Both fetches must be in flight at once to get past the barrier
+            barrier.wait()
+            if secret_id.endswith("/a"):
+                return MagicMock(secret_string='{"app/*": "transform-a"}')
+            return MagicMock(secret_string='{"app/*": "transform-b"}')
+
+        mock_client = MagicMock()
+        mock_client.get_secret.side_effect = get_secret
+
+        filters = load_filter_configuration(
+            "secrets-replicator/filters/a,secrets-replicator/filters/b", mock_client
+        )
+
+        assert filters == {"app/*": "transform-b"}
+
     def test_load_empty_filter_list(self):
         """Empty filter list returns empty dict"""
         mock_client = MagicMock()
         filters = load_filter_configuration("", mock_client)
         assert filters == {}
 
+    def test_load_blank_and_comma_only_filter_list(self):
+        """Filter lists with no secret names return empty dict without fetching"""
+        mock_client = MagicMock()
+        for filter_list in ("   ", ",", " , ", ",,  ,"):
+            assert load_filter_configuration(filter_list, mock_client) == {}
+        mock_client.get_secret.assert_not_called()
+
+    def test_load_single_filter_secret_error_is_wrapped(self):
+        """A single filter secret is fetched directly and its errors are still skipped"""
+        mock_client = MagicMock()
+        mock_client.get_secret.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException", "Message": "not found"}},
+            "GetSecretValue",
+        )
+
+        assert load_filter_configuration("secrets-replicator/filters/missing", mock_client) == {}
+        mock_client.get_secret.assert_called_once_with(
+            secret_id="secrets-replicator/filters/missing"
+        )
+
     def test_null_transformation_normalized(self):
         """Null and empty string values are normalized to None"""
         mock_client = MagicMock()
@@ -204,6 +321,103 @@ class TestGetCachedFilters:
         # Should only be called once due to caching
         assert mock_client.get_secret.call_count == 1
 
+    def test_cached_filters_precompile_wildcards(self):
+        """Cached filters carry their wildcard patterns compiled, in filter order"""
+        mock_client = MagicMock()
+        mock_client.get_secret.return_value = MagicMock(
+            secret_string='{"app/*": "transform", "exact": null, "*/prod": "other"}'
+        )
+
+        filters = get_cached_filters("secrets-replicator/filters/test", 300, mock_client)
+
+        assert isinstance(filters, CompiledFilters)
+        assert [pattern for pattern, _, _ in filters.wildcards] == ["app/*", "*/prod"]
+        assert find_matching_filter("app/prod", filters) == "transform"
+        assert find_matching_filter("db/prod", filters) == "other"
+        assert find_matching_filter("exact", filters) is None
+
+    def test_expired_cache_reuses_parse_for_unchanged_version(self):
+        """TTL expiry re-fetches filter secrets but skips re-parsing an unchanged version"""
+        mock_client = MagicMock()
+        mock_client.get_secret.return_value = MagicMock(
+            secret_string='{"app/*": "transform"}', version_id="v1"
+        )
+
+        with patch("orjson.loads", wraps=orjson.loads) as mock_loads:
+            get_cached_filters("secrets-replicator/filters/test", 0, mock_client)
+            filters = get_cached_filters("secrets-replicator/filters/test", 0, mock_client)
+
+        assert filters == {"app/*": "transform"}
+        assert mock_client.get_secret.call_count == 2
+        mock_loads.assert_called_once()
+
+    def test_expired_cache_reparses_new_version(self):
+        """A new filter secret version is parsed again after TTL expiry"""
+        mock_client = MagicMock()
+        mock_client.get_secret.side_effect = [
+            MagicMock(secret_string='{"app/*": "transform-a"}', version_id="v1"),
+            MagicMock(secret_string='{"app/*": "transform-b"}', version_id="v2"),
+        ]
+
+        get_cached_filters("secrets-replicator/filters/test", 0, mock_client)
+        filters = get_cached_filters("secrets-replicator/filters/test", 0, mock_client)
+
+        assert filters == {"app/*": "transform-b"}
+
+    def test_concurrent_misses_load_once(self):
+        """Concurrent cache misses for the same filter list load it only once"""
+        mock_client = MagicMock()
+
+        def slow_get_secret(secret_id):
+            time.sleep(0.05)
+            return MagicMock(secret_string='{"app/*": "transform"}', version_id="v1")
+
+        mock_client.get_secret.side_effect = slow_get_secret
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda _: get_cached_filters(
+                        "secrets-replicator/filters/test", 300, mock_client
+                    ),
+                    range(4),
+                )
+            )
+
+        assert all(result is results[0] for result in results)
+        assert mock_client.get_secret.call_count == 1
+
+    def test_transformation_names_are_interned(self):
+        """Patterns sharing a transformation name share one string object"""
+        mock_client = MagicMock()
+        mock_client.get_secret.return_value = MagicMock(
+            secret_string='{"app/*": "region-swap", "db/*": "region-swap"}'
+        )
+
+        filters = get_cached_filters("secrets-replicator/filters/test", 300, mock_client)
+
+        assert filters["app/*"] is filters["db/*"]
+
+    def test_clear_waits_for_in_flight_load(self):
+        """A clear issued during a load is not undone when the load finishes"""
+        loading = threading.Event()
+        mock_client = MagicMock()
+
+        def slow_get_secret(secret_id):
+            loading.set()
+            time.sleep(0.1)
+            return MagicMock(secret_string='{"app/*": "transform"}', version_id="v1")
+
+        mock_client.get_secret.side_effect = slow_get_secret
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(get_cached_filters, "secrets-replicator/filters/test", 300, mock_client)
+            loading.wait(timeout=5)
+            clear_filter_cache()
+
+        get_cached_filters("secrets-replicator/filters/test", 300, mock_client)
+        assert mock_client.get_secret.call_count == 2
+
     def test_cache_invalidated_on_filter_list_change(self):
         """Cache is invalidated when filter list changes"""
         mock_client = MagicMock()
@@ -416,10 +630,15 @@ class TestShouldReplicateComplexScenarios:
             secrets_filter="secrets-replicator/filters/base,secrets-replicator/filters/override",
         )
         mock_client = MagicMock()
-        mock_client.get_secret.side_effect = [
-            MagicMock(secret_string='{"app/*": "base-transform"}'),
-            MagicMock(secret_string='{"app/prod/*": "prod-transform"}'),
-        ]
+        responses = {
+            "secrets-replicator/filters/base": MagicMock(
+                secret_string='{"app/*": "base-transform"}'
+            ),
+            "secrets-replicator/filters/override": MagicMock(
+                secret_string='{"app/prod/*": "prod-transform"}'
+            ),
+        }
+        mock_client.get_secret.side_effect = lambda secret_id: responses[secret_id]
 
         # Both patterns match, but app/* is checked first (dict iteration order)
         # The merged dict has both patterns, first wildcard match wins
@@ -13,7 +13,7 @@ class TestMetricsPublisher:
 
     def test_init_enabled(self):
         """Test metrics publisher initialization when enabled"""
-        with patch("metrics.boto3.client") as mock_boto_client:
+        with patch("boto3.client") as mock_boto_client:
             mock_boto_client.return_value = Mock()
             publisher = MetricsPublisher(enabled=True)
 
@@ -30,7 +30,7 @@ class TestMetricsPublisher:
 
     def test_init_boto3_failure(self):
         """Test graceful handling of boto3 client initialization failure"""
-        with patch("metrics.boto3.client", side_effect=Exception("AWS error")):
+        with patch("boto3.client", side_effect=Exception("AWS error")):
             publisher = MetricsPublisher(enabled=True)
 
             assert publisher.enabled is False
@@ -38,7 +38,7 @@ class TestMetricsPublisher:
     def test_publish_replication_success(self):
         """Test publishing replication success metrics"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             publisher.publish_replication_success(
@@ -68,7 +68,7 @@ class TestMetricsPublisher:
     def test_publish_replication_success_without_size(self):
         """Test publishing replication success without secret size"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             publisher.publish_replication_success(
@@ -86,7 +86,7 @@ class TestMetricsPublisher:
     def test_publish_replication_failure(self):
         """Test publishing replication failure metrics"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             publisher.publish_replication_failure(
@@ -110,7 +110,7 @@ class TestMetricsPublisher:
     def test_publish_transformation_metrics(self):
         """Test publishing transformation metrics"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             publisher.publish_transformation_metrics(
@@ -137,7 +137,7 @@ class TestMetricsPublisher:
     def test_publish_retry_metrics(self):
         """Test publishing retry metrics"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             publisher.publish_retry_metrics(operation="get_secret", attempt_number=3, success=True)
@@ -156,7 +156,7 @@ class TestMetricsPublisher:
     def test_publish_throttling_event(self):
         """Test publishing throttling event"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             publisher.publish_throttling_event(operation="put_secret", region="us-west-2")
@@ -183,7 +183,7 @@ class TestMetricsPublisher:
         mock_client = MagicMock()
         mock_client.put_metric_data.side_effect = Exception("CloudWatch error")
 
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             # Should not raise exception
@@ -194,7 +194,7 @@ class TestMetricsPublisher:
     def test_dimensions_included(self):
         """Test that proper dimensions are included in metrics"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             publisher.publish_replication_success(
@@ -218,7 +218,7 @@ class TestMetricsPublisher:
     def test_timestamp_added_to_metrics(self):
         """Test that timestamp is added to all metrics"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             publisher.publish_replication_success(
@@ -236,7 +236,7 @@ class TestMetricsPublisher:
     def test_batch_publishing(self):
         """Test that metrics are published in batches of 20"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             # Create 25 metrics (should result in 2 batches)
@@ -260,14 +260,14 @@ class TestGetMetricsPublisher:
 
     def test_get_metrics_publisher_creates_instance(self):
         """Test that get_metrics_publisher creates an instance"""
-        with patch("metrics.boto3.client"):
+        with patch("boto3.client"):
             publisher = get_metrics_publisher()
             assert publisher is not None
             assert isinstance(publisher, MetricsPublisher)
 
     def test_get_metrics_publisher_returns_same_instance(self):
         """Test that subsequent calls return the same instance"""
-        with patch("metrics.boto3.client"):
+        with patch("boto3.client"):
             publisher1 = get_metrics_publisher()
             publisher2 = get_metrics_publisher()
 
@@ -284,7 +284,7 @@ class TestResetMetricsPublisher:
 
     def test_reset_clears_global_instance(self):
         """Test that reset clears the global instance"""
-        with patch("metrics.boto3.client"):
+        with patch("boto3.client"):
             publisher1 = get_metrics_publisher()
             reset_metrics_publisher()
             publisher2 = get_metrics_publisher()
@@ -298,7 +298,7 @@ class TestEdgeCases:
     def test_empty_metrics_list(self):
         """Test publishing empty metrics list"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
             publisher._publish_metrics([])
 
@@ -308,7 +308,7 @@ class TestEdgeCases:
     def test_custom_namespace(self):
         """Test using custom namespace"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher(namespace="CustomNamespace")
 
             publisher.publish_replication_success(
@@ -321,7 +321,7 @@ class TestEdgeCases:
     def test_metric_units(self):
         """Test that proper units are used for metrics"""
         mock_client = MagicMock()
-        with patch("metrics.boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client):
             publisher = MetricsPublisher()
 
             publisher.publish_replication_success(
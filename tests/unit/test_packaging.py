@@ -0,0 +1,95 @@
+"""
+Unit tests for the Lambda deployment package (src/)
+
+sam build installs src/requirements.txt into the function (CodeUri: src/), so every
+third-party module imported under src/, including lazy imports inside functions, must
+be listed there.
+"""
+
+import ast
+import importlib.metadata
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+def _normalize(name):
+    """PEP 503 normalized distribution name"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _packaged_requirements():
+    """Normalized distribution names listed in src/requirements.txt"""
+    names = set()
+    for line in (SRC_DIR / "requirements.txt").read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            names.add(_normalize(re.split(r"[\s\[<>=!~;]", line, maxsplit=1)[0]))
+    return names
+
+
+def _third_party_imports():
+    """Top-level third-party module names imported anywhere under src/"""
+    local_modules = {path.stem for path in SRC_DIR.glob("*.py")}
+    modules = set()
+    for path in SRC_DIR.glob("*.py"):
+        for node in ast.walk(ast.parse(path.read_text(), filename=str(path))):
+            if isinstance(node, ast.Import):
+                modules.update(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                modules.add(node.module.split(".")[0])
+    return modules - local_modules - set(sys.stdlib_module_names)
+
+
+class TestLambdaRequirements:
+    """Tests for src/requirements.txt"""
+
+    def test_every_src_import_is_packaged(self):
+        """Test that each third-party module imported in src/ is in src/requirements.txt"""
+        distributions = importlib.metadata.packages_distributions()
+        packaged = _packaged_requirements()
+
+        missing = {
+            module
+            for module in _third_party_imports()
+            if not {_normalize(name) for name in distributions.get(module, [module])} & packaged
+        }
+
+        assert not missing, f"Imported in src/ but missing from src/requirements.txt: {missing}"
+
+    def test_lazily_imported_orjson_is_packaged(self):
+        """Test orjson, imported only on first use, is packaged and importable"""
+        assert "orjson" in _third_party_imports()
+        assert "orjson" in _packaged_requirements()
+        importlib.import_module("orjson")
+
+
+class TestLazyImport:
+    """Tests that heavy dependencies stay off the cold-start import path"""
+
+    @pytest.mark.parametrize(
+        "module, deferred",
+        [
+            # The Lambda entry point, and everything it imports
+            ("handler", "boto3"),
+            ("aws_clients", "boto3"),
+            # Imported for its prefix constants by filters and name_mappings
+            ("config", "orjson"),
+        ],
+    )
+    def test_module_import_does_not_load(self, module, deferred):
+        """Test importing module does not import deferred until it is first used"""
+        result = subprocess.run(
+            [sys.executable, "-c", f"import sys, {module}; print({deferred!r} in sys.modules)"],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"